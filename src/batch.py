@@ -0,0 +1,160 @@
+"""
+Headless batch solver.
+
+Solves every (map, algorithm) pair across a process pool and writes one JSON
+result per line. Run from the ``src`` directory, like ``main.py``:
+
+    python batch.py maps/ -a BFS "A*" -o results.jsonl
+    python batch.py "generated/*.json" -a IDA* -j 32 -t 10
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import SETTINGS
+from core import load_map_from_json
+from solvers import get_solver_class, SolverTimeout, VISITED_STORES, parse_visited_store
+
+
+def find_maps(sources):
+    """
+    Expand directories and glob patterns into a sorted list of map files.
+
+    Args:
+        sources (list): Directories (every ``*.json`` inside is used) or glob
+            patterns.
+
+    Returns:
+        list: Paths of the map files, without duplicates.
+    """
+    paths = set()
+    for source in sources:
+        if os.path.isdir(source):
+            paths.update(glob.glob(os.path.join(source, "*.json")))
+        else:
+            paths.update(glob.glob(source))
+    return sorted(paths)
+
+
+def solve_job(map_path, algorithm, move_model, time_limit, with_path=False, visited="dict"):
+    """
+    Solve one map with one algorithm. Runs inside a worker process.
+
+    Returns:
+        dict: The job description plus ``status`` ("solved", "no_solution",
+        "timeout" or "error") and the solver's statistics.
+    """
+    result = {
+        "map": map_path,
+        "algorithm": algorithm,
+        "move_model": move_model,
+    }
+    start = time.time()
+    try:
+        board = load_map_from_json(map_path)
+        solver = get_solver_class(algorithm)(board, move_model=move_model)
+        solver.visited_store = visited
+        if time_limit:
+            solver.deadline = start + time_limit
+        stats = solver.solve()
+    except SolverTimeout:
+        result.update(status="timeout", time=time.time() - start)
+        return result
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}", time=time.time() - start)
+        return result
+
+    path = stats.pop("path")
+    result.update(stats)
+    result["status"] = "solved" if path else "no_solution"
+    result["moves"] = len(path) - 1 if path else None
+    if with_path:
+        result["path"] = path
+    return result
+
+
+def run_batch(map_paths, algorithms, output, move_model="step", time_limit=None, workers=None, with_path=False,
+              visited="dict"):
+    """
+    Solve every (map, algorithm) pair and append the results to ``output``.
+
+    Results are written as soon as each job finishes, so the order of lines
+    follows completion order rather than submission order.
+
+    Returns:
+        dict: Number of jobs per status.
+    """
+    summary = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve_job, map_path, algorithm, move_model, time_limit, with_path, visited)
+            for map_path in map_paths
+            for algorithm in algorithms
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return summary
+
+
+def visited_store_arg(text):
+    try:
+        parse_visited_store(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return text
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Solve Rush Hour maps in parallel and write JSONL results.")
+    parser.add_argument("maps", nargs="+", help="map directories or glob patterns")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=SETTINGS["ALGORITHMS"],
+                        help="algorithms to run on every map (default: SETTINGS['ALGORITHMS'])")
+    parser.add_argument("-m", "--move-model", choices=["step", "slide"], default=SETTINGS["MOVE_MODEL"])
+    parser.add_argument("-t", "--time-limit", type=float, default=SETTINGS["TIME_LIMIT"],
+                        help="seconds per job, 0 for no limit (default: SETTINGS['TIME_LIMIT'])")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file, '-' for stdout")
+    parser.add_argument("--with-path", action="store_true", help="include the solution path in each result")
+    parser.add_argument("--visited", type=visited_store_arg, default="dict",
+                        help="visited-state store for graph-search solvers: "
+                             f"{', '.join(VISITED_STORES)}, optionally with arguments such as "
+                             "bloom:capacity=200000,error_rate=1e-5 (default: dict)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    for algorithm in args.algorithms:
+        get_solver_class(algorithm)
+
+    map_paths = find_maps(args.maps)
+    if not map_paths:
+        print("No maps found", file=sys.stderr)
+        return 1
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        summary = run_batch(map_paths, args.algorithms, output, args.move_model,
+                            args.time_limit or None, args.workers, args.with_path, args.visited)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"{len(map_paths)} maps x {len(args.algorithms)} algorithms: "
+          + ", ".join(f"{count} {status}" for status, count in sorted(summary.items())),
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Solver benchmark harness.
+
+Runs every registered solver over a set of maps, repeats each run to measure
+variance, and writes a JSON report that can be compared against a stored
+baseline. Run from the ``src`` directory:
+
+    python benchmark.py -o bench.json
+    python benchmark.py maps/ generated/ -a BFS "A*" -r 10 --baseline bench.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import find_maps
+from config import SETTINGS
+from core import load_map_from_json
+from solvers import SOLVERS, get_solver_class, SolverTimeout
+
+
+def run_once(board, solver_class, move_model, time_limit, trace_memory=False):
+    """
+    Build a solver for ``board`` and time one ``solve()`` with ``perf_counter``.
+
+    Returns:
+        tuple: (seconds, solver result, peak traced bytes or None). The result
+        is None if the run hit ``time_limit``.
+    """
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        solver = solver_class(board, move_model=move_model)
+        if time_limit:
+            solver.deadline = time.time() + time_limit
+        start = time.perf_counter()
+        try:
+            result = solver.solve()
+        except SolverTimeout:
+            result = None
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return elapsed, result, peak
+
+
+def benchmark_case(map_path, algorithm, repeats, move_model, time_limit):
+    """
+    Benchmark one (map, algorithm) pair.
+
+    Timing runs are done without tracemalloc, which slows allocation-heavy
+    code down; one extra traced run measures the peak memory.
+
+    Returns:
+        dict: Timing summary (mean, stdev, min, median), nodes per second,
+        peak memory and the solver's own counters.
+    """
+    board = load_map_from_json(map_path)
+    solver_class = get_solver_class(algorithm)
+
+    times = []
+    result = None
+    for _ in range(repeats):
+        elapsed, result, _ = run_once(board, solver_class, move_model, time_limit)
+        if result is None:
+            return {"status": "timeout", "time_limit": time_limit}
+        times.append(elapsed)
+
+    _, _, peak = run_once(board, solver_class, move_model, time_limit, trace_memory=True)
+
+    mean = statistics.mean(times)
+    path = result["path"]
+    return {
+        "status": "solved" if path else "no_solution",
+        "moves": len(path) - 1 if path else None,
+        "expanded": result["expanded"],
+        "space": result["space"],
+        "time_mean": mean,
+        "time_stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "time_min": min(times),
+        "time_median": statistics.median(times),
+        "nodes_per_sec": result["expanded"] / mean if mean > 0 else None,
+        "peak_memory": peak,
+        "repeats": repeats,
+    }
+
+
+def run_benchmark(map_paths, algorithms, repeats=5, move_model="step", time_limit=None, log=sys.stderr):
+    results = {}
+    for map_path in map_paths:
+        for algorithm in algorithms:
+            case = benchmark_case(map_path, algorithm, repeats, move_model, time_limit)
+            results[f"{map_path}|{algorithm}"] = case
+            if case["status"] == "timeout":
+                print(f"{map_path:28s} {algorithm:6s} timeout", file=log)
+            else:
+                print(f"{map_path:28s} {algorithm:6s} {case['time_mean'] * 1000:9.2f} ms "
+                      f"± {case['time_stdev'] * 1000:7.2f}  {case['expanded']:8d} exp  "
+                      f"{case['peak_memory'] / 1024:9.1f} KiB", file=log)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "move_model": move_model,
+            "repeats": repeats,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Compare a report with a baseline report.
+
+    A case regresses when its mean time or peak memory grows by more than
+    ``threshold`` (a fraction), when its time exceeds the baseline mean by
+    more than two baseline standard deviations as well, or when it expands
+    a different number of nodes.
+
+    Returns:
+        list: (key, metric, baseline value, new value) for every regression.
+    """
+    regressions = []
+    for key, new in report["results"].items():
+        old = baseline["results"].get(key)
+        if not old or old["status"] != "solved" or new["status"] != "solved":
+            if old and old["status"] != new["status"]:
+                regressions.append((key, "status", old["status"], new["status"]))
+            continue
+
+        slower = new["time_mean"] > old["time_mean"] * (1 + threshold)
+        outside_noise = new["time_mean"] > old["time_mean"] + 2 * old["time_stdev"]
+        if slower and outside_noise:
+            regressions.append((key, "time_mean", old["time_mean"], new["time_mean"]))
+        if new["peak_memory"] > old["peak_memory"] * (1 + threshold):
+            regressions.append((key, "peak_memory", old["peak_memory"], new["peak_memory"]))
+        if new["expanded"] != old["expanded"]:
+            regressions.append((key, "expanded", old["expanded"], new["expanded"]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Rush Hour solvers.")
+    parser.add_argument("maps", nargs="*", default=["maps/"],
+                        help="map directories or glob patterns (default: maps/)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=list(SOLVERS),
+                        help="algorithms to benchmark (default: every registered solver)")
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument("-m", "--move-model", choices=["step", "slide"], default=SETTINGS["MOVE_MODEL"])
+    parser.add_argument("-t", "--time-limit", type=float, default=SETTINGS["TIME_LIMIT"],
+                        help="seconds per run, 0 for no limit (default: SETTINGS['TIME_LIMIT'])")
+    parser.add_argument("-o", "--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown/memory growth reported as a regression (default: 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    map_paths = find_maps(args.maps)
+    if not map_paths:
+        print("No maps found", file=sys.stderr)
+        return 1
+
+    report = run_benchmark(map_paths, args.algorithms, args.repeats, args.move_model, args.time_limit or None)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for key, metric, old, new in regressions:
+            print(f"REGRESSION {key} {metric}: {old} -> {new}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
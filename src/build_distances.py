@@ -0,0 +1,58 @@
+"""
+Build exact distance-to-goal databases for maps.
+
+For every map, enumerates the whole component reachable from its initial
+board and writes ``<board hash>.<move model>.rhdb`` into the output
+directory, where ``AStarSolver(heuristic="exact")`` and the playing screen's
+hints pick it up. Run from the ``src`` directory:
+
+    python build_distances.py maps/ -m step slide
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import find_maps
+from config import SETTINGS
+from core import load_map_from_json
+from rushhour.distances import DistanceDatabase
+
+
+def build_for_map(map_path, move_model, directory):
+    board = load_map_from_json(map_path)
+    vehicles = board.serialize()
+    start = time.time()
+    database = DistanceDatabase.build(board.size, vehicles, move_model)
+    path = DistanceDatabase.path_for(directory, database.board_hash, move_model)
+    database.save(path)
+    distance = database.distance(vehicles)
+    print(f"{map_path} [{move_model}]: {len(database)} states, "
+          f"initial distance {distance}, {time.time() - start:.2f}s -> {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build exact distance-to-goal databases for maps.")
+    parser.add_argument("maps", nargs="+", help="map directories or glob patterns")
+    parser.add_argument("-m", "--move-models", nargs="+", choices=["step", "slide"],
+                        default=[SETTINGS["MOVE_MODEL"]])
+    parser.add_argument("-o", "--output", default=SETTINGS["DISTANCE_DB_DIR"],
+                        help="output directory (default: SETTINGS['DISTANCE_DB_DIR'])")
+    args = parser.parse_args(argv)
+
+    map_paths = find_maps(args.maps)
+    if not map_paths:
+        print("No maps found", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.output, exist_ok=True)
+    for map_path in map_paths:
+        for move_model in args.move_models:
+            build_for_map(map_path, move_model, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from .board import Board
 from .vehicle import Vehicle
-from .map_loader import load_map_from_json
+from .map_loader import load_map_from_json, load_map_from_string, iter_maps
+from .map_catalog import MapCatalog
+from .playback import Playback
 
-__all__ = ["Board", "Vehicle", "load_map_from_json"]
\ No newline at end of file
+__all__ = ["Board", "Vehicle", "load_map_from_json", "load_map_from_string", "iter_maps", "MapCatalog", "Playback"]
\ No newline at end of file
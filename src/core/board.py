@@ -15,6 +15,9 @@ class Board:
                 'orientation': vehicle.orientation,
                 'name': vehicle.name
             }
+        # Font và lưới tĩnh được tạo ở lần vẽ đầu tiên (cần pygame đã khởi tạo)
+        self.font = None
+        self.grid_surface = None
 
     @classmethod
     def from_dict(cls, data):
@@ -23,6 +26,13 @@ class Board:
         vehicles = [Vehicle(**v) for v in data["vehicles"]]
         return cls(data["size"], vehicles)
 
+    def serialize(self):
+        """Vehicles as (row, col, length, orientation, name) tuples, the order solver states use."""
+        return tuple(
+            (v.row, v.col, v.length, v.orientation, v.name)
+            for v in self.vehicles.values()
+        )
+
     def reset_to_initial_state(self):
         for name, initial_data in self.initial_state.items():
             if name in self.vehicles:
@@ -33,36 +43,74 @@ class Board:
                 vehicle.orientation = initial_data['orientation']
                 vehicle.name = initial_data['name']
 
-    def apply_move(self, state):
-        if not state:
-            return
-            
-        for vehicle_data in state:
-            row, col, length, orientation, name = vehicle_data
-            if name in self.vehicles:
-                vehicle = self.vehicles[name]
-                vehicle.row = row
-                vehicle.col = col
-                vehicle.length = length
-                vehicle.orientation = orientation
+    def move_vehicle(self, name, delta):
+        """Shift one vehicle ``delta`` cells along its lane."""
+        vehicle = self.vehicles[name]
+        if vehicle.orientation == 'H':
+            vehicle.col += delta
+        else:
+            vehicle.row += delta
 
-    def draw(self, screen, pos=(0, 0)):
+    def set_lane_position(self, name, position):
+        """Place one vehicle at ``position`` along its lane (column if horizontal, row if vertical)."""
+        vehicle = self.vehicles[name]
+        if vehicle.orientation == 'H':
+            vehicle.col = position
+        else:
+            vehicle.row = position
+
+    def get_rect(self, pos=(0, 0)):
         cell_size = SETTINGS["CELL_SIZE"]
-        # Tạo font cho việc hiển thị tên vehicle
-        font = pygame.font.Font(None, max(16, cell_size // 3))
-        
+        return pygame.Rect(pos[0], pos[1], self.size[1] * cell_size, self.size[0] * cell_size)
+
+    def build_grid_surface(self, cell_size):
+        """
+        Pre-render the empty grid once; each frame then blits it in one call.
+
+        The surface is transparent outside the grid lines, so the caller's
+        background shows through.
+        """
         # Độ dày border của grid (có thể điều chỉnh theo ý muốn)
         border_width = max(1, cell_size // 30)  # Tối thiểu 1px, mỏng hơn
-        
+
+        surface = pygame.Surface(self.get_rect().size, pygame.SRCALPHA)
         for i in range(self.size[0]):
             for j in range(self.size[1]):
-                pygame.draw.rect(screen, (255, 255, 255), (
-                    pos[0] + j * cell_size, pos[1] + i * cell_size, cell_size, cell_size), border_width)
+                pygame.draw.rect(surface, (255, 255, 255), (
+                    j * cell_size, i * cell_size, cell_size, cell_size), border_width)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
 
+    def draw(self, screen, pos=(0, 0), motion=None):
+        """
+        Draw the grid and the vehicles at ``pos``.
+
+        ``motion`` is an optional (vehicle name, offset in cells) pair that
+        draws that vehicle part of the way along its lane, for animation.
+
+        The font and the grid surface are created on the first call and reused
+        afterwards.
+
+        Returns:
+            pygame.Rect: The screen area the board covers.
+        """
+        cell_size = SETTINGS["CELL_SIZE"]
+        if self.font is None:
+            # Tạo font cho việc hiển thị tên vehicle
+            self.font = pygame.font.Font(None, max(16, cell_size // 3))
+            self.grid_surface = self.build_grid_surface(cell_size)
+
+        screen.blit(self.grid_surface, pos)
+
+        moving, offset = motion if motion else (None, 0)
         for v in self.vehicles.values():
             color = v.get_color()  # Sử dụng màu riêng của từng vehicle
-            rect = v.get_rect(pos, cell_size)
+            v_offset = offset if v.name == moving else 0
+            rect = v.get_rect(pos, cell_size, v_offset)
             pygame.draw.rect(screen, color, rect)
             
             # Vẽ tên vehicle lên màn hình
-            v.draw_name(screen, pos, cell_size, font)
+            v.draw_name(screen, pos, cell_size, self.font, v_offset)
+
+        return self.get_rect(pos)
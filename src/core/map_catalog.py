@@ -0,0 +1,192 @@
+"""
+Indexed catalogue of the map files in a directory.
+
+Scanning and parsing every map each time a scene opens does not scale to
+large puzzle packs. ``MapCatalog`` keeps a small JSON index next to the maps
+(``.index`` by default) with each file's metadata:
+
+- ``size``: board dimensions,
+- ``vehicles``: number of vehicles,
+- ``depth`` and ``move_model``: optimal solution length and the move model
+  it is counted in, if known (the ``moves``/``move_model`` fields written by
+  ``generate.py`` and ``retrograde.py``),
+- ``mtime``/``bytes``: used to skip unchanged files when rescanning.
+
+Files that are not valid maps (see ``rushhour.validation``) are indexed with
+their error and left out of ``names``.
+
+Opening a catalogue reads the index and stats the directory once. The scan
+only runs again when the directory's modification time changes (a file was
+added, removed or renamed), and then re-parses only files whose mtime or size
+differs from the index. A file edited in place does not touch the
+directory, so its metadata is only updated by the next rescan or
+``rebuild``. Boards are parsed on first use and the parsed map data is kept
+in a bounded LRU cache; every ``load`` returns a fresh ``Board`` since
+boards are mutated during playback.
+"""
+from collections import OrderedDict
+import json
+import os
+import re
+
+from core.map_loader import board_from_dict
+from rushhour.validation import InvalidMapError, validate_map
+
+INDEX_VERSION = 2
+
+
+def natural_key(name):
+    """Sort key that orders map2 before map10."""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
+
+
+class MapCatalog:
+    """
+    Args:
+        directory (str): Folder containing ``*.json`` map files.
+        index_name (str): File name of the index inside ``directory``.
+        cache_size (int): Parsed maps kept in memory.
+    """
+
+    # Catalogue dùng chung theo thư mục, để mỗi lần mở scene không phải quét lại
+    _shared = {}
+
+    def __init__(self, directory, index_name=".index", cache_size=256):
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_name)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.entries = {}
+        self.directory_mtime = None
+        self.sorted_names = None
+
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                self.entries = index["maps"]
+                self.directory_mtime = index["mtime"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self.check()
+
+    @classmethod
+    def shared(cls, directory, **kwargs):
+        """Return the catalogue of ``directory``, opening it on first use."""
+        key = (os.path.abspath(directory), tuple(sorted(kwargs.items())))
+        catalog = cls._shared.get(key)
+        if catalog is None:
+            catalog = cls._shared[key] = cls(directory, **kwargs)
+        else:
+            catalog.check()
+        return catalog
+
+    def check(self):
+        """Rescan if the directory changed since the index was written (one ``stat``)."""
+        if os.stat(self.directory).st_mtime_ns != self.directory_mtime:
+            self.refresh()
+
+    def refresh(self):
+        """Rescan the directory, re-reading only new or modified files, and save the index."""
+        entries = {}
+        changed = False
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith(".json") or not item.is_file():
+                    continue
+                stat = item.stat()
+                entry = self.entries.get(item.name)
+                if entry is None or entry["mtime"] != stat.st_mtime_ns or entry["bytes"] != stat.st_size:
+                    entry = self.describe(item.path, stat)
+                    self.cache.pop(item.name, None)
+                    changed = True
+                entries[item.name] = entry
+
+        changed = changed or entries.keys() != self.entries.keys()
+        self.entries = entries
+        self.sorted_names = None
+        mtime = os.stat(self.directory).st_mtime_ns
+        if changed or mtime != self.directory_mtime:
+            self.directory_mtime = mtime
+            self.save()
+
+    def rebuild(self):
+        """Re-read every file, ignoring the index."""
+        self.entries = {}
+        self.cache.clear()
+        self.refresh()
+
+    def describe(self, path, stat):
+        entry = {"mtime": stat.st_mtime_ns, "bytes": stat.st_size}
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            validate_map(data)
+            entry["size"] = list(data["size"])
+            entry["vehicles"] = len(data["vehicles"])
+        except (OSError, ValueError) as e:
+            # Ghi lại lỗi (kể cả map không hợp lệ) để không phải đọc lại file hỏng ở mỗi lần quét
+            entry["error"] = f"{type(e).__name__}: {e}"
+            return entry
+
+        entry["depth"] = data.get("moves")
+        entry["move_model"] = data.get("move_model")
+        return entry
+
+    def save(self):
+        try:
+            if not os.path.exists(self.index_path):
+                open(self.index_path, "w").close()
+            # Tạo file làm đổi mtime của thư mục; ghi đè nội dung file đã có thì không,
+            # nên mtime đọc sau bước này là mtime mà lần mở sau sẽ thấy
+            self.directory_mtime = os.stat(self.directory).st_mtime_ns
+            index = {"version": INDEX_VERSION, "mtime": self.directory_mtime, "maps": self.entries}
+            with open(self.index_path, "w") as f:
+                json.dump(index, f, separators=(",", ":"))
+        except OSError:
+            # Thư mục chỉ đọc: vẫn dùng được catalogue, chỉ là không lưu chỉ mục
+            pass
+
+    def names(self):
+        """Loadable map file names in natural order."""
+        if self.sorted_names is None:
+            self.sorted_names = sorted(
+                (name for name, entry in self.entries.items() if "error" not in entry), key=natural_key)
+        return self.sorted_names
+
+    def __len__(self):
+        return len(self.names())
+
+    def __contains__(self, name):
+        return name in self.entries and "error" not in self.entries[name]
+
+    def metadata(self, name):
+        """Index entry of ``name``."""
+        return self.entries[name]
+
+    def load_data(self, name):
+        """Parsed map data of ``name``, read from disk at most once while cached."""
+        data = self.cache.get(name)
+        if data is not None:
+            self.cache.move_to_end(name)
+            return data
+
+        with open(os.path.join(self.directory, name), "r") as f:
+            data = json.load(f)
+        self.cache[name] = data
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return data
+
+    def load(self, name):
+        """
+        A new ``Board`` for map ``name``.
+
+        Raises:
+            InvalidMapError: If the file no longer holds a valid map.
+        """
+        try:
+            return board_from_dict(self.load_data(name))
+        except ValueError as e:
+            self.cache.pop(name, None)
+            raise InvalidMapError(f"{name}: {e}") from None
@@ -1,7 +1,102 @@
+"""
+Map loading.
+
+Every loader validates the map with ``rushhour.validation`` before building
+a ``Board``, so a malformed board, a vehicle off the grid or overlapping
+another, or a missing or vertical X is reported as ``InvalidMapError`` when
+the map is read instead of surfacing later as a search that can never reach
+a goal.
+"""
 import json
+
 from core.board import Board
+from core.vehicle import Vehicle
+from rushhour.validation import InvalidMapError, validate_map, validate_vehicles
+
+
+def board_from_dict(data):
+    """Validate a map dict and build its ``Board``."""
+    validate_map(data)
+    return Board.from_dict(data)
+
+
+def board_from_vehicles(size, vehicles):
+    """Validate (row, col, length, orientation, name) tuples and build their ``Board``."""
+    validate_vehicles(size, vehicles)
+    Vehicle.reset_colors()
+    return Board(tuple(size), [Vehicle(name, row, col, length, orientation)
+                               for row, col, length, orientation, name in vehicles])
+
+
+def load_map_from_string(text):
+    """
+    Build a ``Board`` from a map in JSON text.
+
+    Raises:
+        InvalidMapError: If the text is not JSON or the map is invalid.
+    """
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise InvalidMapError(f"Invalid JSON: {e}") from None
+    return board_from_dict(data)
+
 
 def load_map_from_json(path):
+    """
+    Build a ``Board`` from a JSON map file.
+
+    Raises:
+        InvalidMapError: If the file is not JSON or the map is invalid; the
+            message starts with ``path``.
+    """
     with open(path, "r") as f:
-        data = json.load(f)
-    return Board.from_dict(data)
+        text = f.read()
+    try:
+        return load_map_from_string(text)
+    except InvalidMapError as e:
+        raise InvalidMapError(f"{path}: {e}") from None
+
+
+def iter_maps(paths, skip_invalid=False):
+    """
+    Stream boards from JSON map files and puzzle packs, one at a time.
+
+    ``paths`` may be any iterable, including a generator, and nothing is
+    read before it is needed. Files ending in ``.rhpk`` are read as
+    ``rushhour.pack`` puzzle packs, every other file as a JSON map.
+
+    Args:
+        paths (iterable): Map or pack files.
+        skip_invalid (bool): Skip invalid maps instead of raising.
+
+    Yields:
+        tuple: (source, Board), where source is the file path, or
+        ``"pack:name"`` for a puzzle of a pack.
+
+    Raises:
+        InvalidMapError: On the first invalid map unless ``skip_invalid``.
+    """
+    for path in paths:
+        if path.endswith(".rhpk"):
+            from rushhour.pack import PuzzlePack
+
+            with PuzzlePack(path) as pack:
+                for index, vehicles in enumerate(pack):
+                    source = f"{path}:{pack.name(index) or index}"
+                    try:
+                        board = board_from_vehicles(pack.size, vehicles)
+                    except InvalidMapError as e:
+                        if skip_invalid:
+                            continue
+                        raise InvalidMapError(f"{source}: {e}") from None
+                    yield source, board
+            continue
+
+        try:
+            board = load_map_from_json(path)
+        except InvalidMapError:
+            if skip_invalid:
+                continue
+            raise
+        yield path, board
@@ -0,0 +1,153 @@
+"""
+Solution playback.
+
+Solvers return a solution as a list of full board states, one
+(row, col, length, orientation, name) tuple per vehicle per step. A move
+only ever shifts one vehicle along its lane, so ``Playback`` keeps the path
+as one (vehicle, delta) diff per move plus the lane positions of every
+vehicle at each ``checkpoint_interval``-th step. Any step is rebuilt from
+the nearest checkpoint below it with at most ``checkpoint_interval - 1``
+diffs, so seeking costs the same however long the solution is.
+
+The playhead is a float counted in moves and advanced by elapsed time, so
+playback speed does not depend on the frame rate, and the fractional part
+says how far the vehicle of the current move has slid towards its next
+cell.
+"""
+from array import array
+
+
+def lane_position(vehicle):
+    """Position of a vehicle tuple along its lane: column if horizontal, row if vertical."""
+    row, col, length, orientation, name = vehicle
+    return col if orientation == 'H' else row
+
+
+class Playback:
+    """
+    Seekable, time-driven replay of a solution path.
+
+    Args:
+        path (list): Board states from the initial one to the goal.
+        checkpoint_interval (int): Moves between stored full states.
+        speed (float): Moves per second.
+
+    Raises:
+        ValueError: If the path is empty or a step does not move exactly one vehicle.
+    """
+
+    # Các tốc độ (nước đi mỗi giây) chọn được bằng faster() / slower()
+    SPEEDS = (0.5, 1, 2, 4, 8, 16, 32, 64)
+
+    def __init__(self, path, checkpoint_interval=16, speed=2):
+        if not path:
+            raise ValueError("Cannot play back an empty solution path")
+
+        self.names = [vehicle[4] for vehicle in path[0]]
+        index = {name: i for i, name in enumerate(self.names)}
+        self.checkpoint_interval = checkpoint_interval
+        self.movers = array('B')
+        self.deltas = array('b')
+
+        current = array('b', (lane_position(vehicle) for vehicle in path[0]))
+        self.checkpoints = [array('b', current)]
+        for step, state in enumerate(path[1:], 1):
+            moved = [
+                (index[vehicle[4]], lane_position(vehicle)) for vehicle in state
+                if lane_position(vehicle) != current[index[vehicle[4]]]
+            ]
+            if len(moved) != 1:
+                raise ValueError(f"Step {step} of the solution moves {len(moved)} vehicles")
+            mover, position = moved[0]
+            self.movers.append(mover)
+            self.deltas.append(position - current[mover])
+            current[mover] = position
+            if step % checkpoint_interval == 0:
+                self.checkpoints.append(array('b', current))
+
+        self.speed = speed
+        self.position = 0.0
+        self.playing = False
+        # Bước mà bàn cờ đang hiển thị (xem sync)
+        self.shown_step = 0
+
+    def __len__(self):
+        return len(self.movers)
+
+    @property
+    def step(self):
+        return int(self.position)
+
+    @property
+    def fraction(self):
+        return self.position - int(self.position)
+
+    @property
+    def finished(self):
+        return self.position >= len(self)
+
+    def move(self, step):
+        """(vehicle name, delta) of the move from ``step`` to ``step + 1``."""
+        return self.names[self.movers[step]], self.deltas[step]
+
+    def positions_at(self, step):
+        """Lane positions of every vehicle after ``step`` moves."""
+        base = step // self.checkpoint_interval
+        positions = array('b', self.checkpoints[base])
+        for i in range(base * self.checkpoint_interval, step):
+            positions[self.movers[i]] += self.deltas[i]
+        return positions
+
+    def play(self):
+        if self.finished:
+            self.position = 0.0
+        self.playing = True
+
+    def pause(self):
+        self.playing = False
+
+    def seek(self, step):
+        """Move the playhead to ``step`` (clamped), dropping any partial move."""
+        self.position = float(min(max(int(step), 0), len(self)))
+
+    def faster(self):
+        self.speed = next((s for s in self.SPEEDS if s > self.speed), self.speed)
+
+    def slower(self):
+        self.speed = next((s for s in reversed(self.SPEEDS) if s < self.speed), self.speed)
+
+    def update(self, dt):
+        """Advance the playhead by ``dt`` milliseconds of playing time."""
+        if not self.playing:
+            return
+        self.position = min(self.position + dt * self.speed / 1000, float(len(self)))
+        if self.finished:
+            self.playing = False
+
+    def sync(self, board):
+        """
+        Bring ``board`` to the playhead's step.
+
+        Stepping one move forward or back touches only the vehicle that
+        moved; longer jumps reset every vehicle from ``positions_at``.
+
+        Returns:
+            tuple: (vehicle name, offset in cells) of the move in progress,
+            or None when the playhead sits exactly on a step.
+        """
+        step = self.step
+        if step == self.shown_step + 1:
+            board.move_vehicle(*self.move(self.shown_step))
+        elif step == self.shown_step - 1:
+            name, delta = self.move(step)
+            board.move_vehicle(name, -delta)
+        elif step != self.shown_step:
+            for name, position in zip(self.names, self.positions_at(step)):
+                board.set_lane_position(name, position)
+        self.shown_step = step
+
+        fraction = self.fraction
+        if not fraction or step >= len(self):
+            return None
+        name, delta = self.move(step)
+        return name, delta * fraction
@@ -11,6 +11,8 @@ class Vehicle:
         self.length = length
         self.orientation = orientation
         self.color = self._generate_unique_color()
+        # (font, tên, surface) của lần render tên gần nhất
+        self.name_glyph = None
 
     @classmethod
     def _generate_unique_color(cls):
@@ -37,22 +39,32 @@ class Vehicle:
     def reset_colors(cls):
         cls._used_colors.clear()
 
-    def get_rect(self, pos, cell_size):
-        x = pos[0] + self.col * cell_size
-        y = pos[1] + self.row * cell_size
+    def get_rect(self, pos, cell_size, offset=0):
+        # offset: số ô (có thể lẻ) dịch thêm dọc theo làn, dùng khi đang chạy hoạt ảnh
+        shift = round(offset * cell_size)
+        x = pos[0] + self.col * cell_size + (shift if self.orientation == 'H' else 0)
+        y = pos[1] + self.row * cell_size + (shift if self.orientation == 'V' else 0)
         width = cell_size * self.length if self.orientation == 'H' else cell_size
         height = cell_size * self.length if self.orientation == 'V' else cell_size
         return pygame.Rect(x, y, width, height)
 
-    def draw_name(self, screen, pos, cell_size, font=None):
+    def get_name_surface(self, font):
+        """Render the name once per font and reuse the surface on later frames."""
+        glyph = self.name_glyph
+        if glyph is None or glyph[0] is not font or glyph[1] != self.name:
+            glyph = (font, self.name, font.render(self.name, True, (255, 255, 255)))
+            self.name_glyph = glyph
+        return glyph[2]
+
+    def draw_name(self, screen, pos, cell_size, font=None, offset=0):
         if font is None:
             font = pygame.font.Font(None, cell_size // 2)
 
-        rect = self.get_rect(pos, cell_size)
+        rect = self.get_rect(pos, cell_size, offset)
         center_x = rect.centerx
         center_y = rect.centery
 
-        text_surface = font.render(self.name, True, (255, 255, 255))
+        text_surface = self.get_name_surface(font)
         text_rect = text_surface.get_rect(center=(center_x, center_y))
 
         screen.blit(text_surface, text_rect)
@@ -17,6 +17,8 @@ class Button:
         self.text_color = text_color
         self.font = pygame.font.Font(None, font_size)
         self.is_hovered = False
+        # (chữ, màu chữ, surface) của lần render gần nhất
+        self.text_cache = None
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -32,6 +34,10 @@ class Button:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)
         
-        text_surface = self.font.render(self.text, True, self.text_color)
+        cache = self.text_cache
+        if cache is None or cache[0] != self.text or cache[1] != self.text_color:
+            cache = (self.text, self.text_color, self.font.render(self.text, True, self.text_color))
+            self.text_cache = cache
+        text_surface = cache[2]
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
@@ -0,0 +1,212 @@
+"""
+Hard puzzle generator.
+
+Samples random valid boards in parallel, solves the whole component each one
+belongs to with a ``DistanceDatabase`` and keeps the position farthest from
+the goal as the puzzle, so every sample yields the hardest start its vehicle
+layout allows. Puzzles are deduplicated by a canonical hash that ignores
+vehicle names, and the hardest ones are written as map files. Run from the
+``src`` directory:
+
+    python generate.py -n 2000 -k 20 -o generated/
+    python generate.py -n 10000 -j 32 --vehicles 10 14 -m slide
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import SETTINGS
+from rushhour.distances import DistanceDatabase
+from rushhour.state import board_hash
+from rushhour.validation import check_valid_positions
+
+# Tên cho các xe khác X, theo thứ tự vị trí trên bàn cờ
+NAMES = [c for c in string.ascii_uppercase if c != "X"]
+
+
+def to_map(size, vehicles, moves=None, move_model=None):
+    """
+    Convert (row, col, length, orientation, name) tuples into the map file format.
+
+    ``moves`` and ``move_model``, when given, record the optimal solution
+    length so ``MapCatalog`` can index it without solving the map.
+    """
+    data = {
+        "size": list(size),
+        "vehicles": [
+            {"name": name, "row": row, "col": col, "length": length, "orientation": orientation}
+            for row, col, length, orientation, name in vehicles
+        ],
+    }
+    if moves is not None:
+        data["moves"] = moves
+        data["move_model"] = move_model
+    return data
+
+
+def canonical(vehicles):
+    """
+    Rename every vehicle except X in reading order of its top-left cell.
+
+    Two boards that differ only in vehicle names map to the same tuple, so
+    ``board_hash`` of the result identifies a puzzle up to naming.
+    """
+    others = sorted(v[:4] for v in vehicles if v[4] != "X")
+    renamed = [v + (NAMES[i],) for i, v in enumerate(others)]
+    renamed.extend(v for v in vehicles if v[4] == "X")
+    return tuple(renamed)
+
+
+def random_board(rng, size, vehicle_range, truck_ratio=0.25, attempts=200):
+    """
+    Place X on its exit row and then random vehicles until the target count is reached.
+
+    Horizontal vehicles are kept off X's row, where they could never let X
+    out. Placements are drawn at random and kept when the layout still passes
+    ``check_valid_positions``.
+
+    Returns:
+        list: (row, col, length, orientation, name) tuples, X last.
+    """
+    rows, cols = size
+    exit_row = (rows - 1) // 2
+    x = (exit_row, rng.randrange(cols - 2), 2, "H", "X")
+    layout = to_map(size, [x])
+    target = rng.randint(*vehicle_range)
+    placed = 0
+
+    for _ in range(attempts):
+        if placed == target:
+            break
+        length = 3 if rng.random() < truck_ratio else 2
+        orientation = rng.choice("HV")
+        if orientation == "H":
+            row, col = rng.randrange(rows), rng.randrange(cols - length + 1)
+            if row == exit_row:
+                continue
+        else:
+            row, col = rng.randrange(rows - length + 1), rng.randrange(cols)
+        layout["vehicles"].append(
+            {"name": NAMES[placed], "row": row, "col": col, "length": length, "orientation": orientation})
+        if check_valid_positions(layout):
+            placed += 1
+        else:
+            layout["vehicles"].pop()
+
+    vehicles = [(v["row"], v["col"], v["length"], v["orientation"], v["name"]) for v in layout["vehicles"][1:]]
+    vehicles.append(x)
+    return vehicles
+
+
+def hardest_in_component(size, vehicles, move_model):
+    """
+    Find the position farthest from the goal in the component of ``vehicles``.
+
+    Returns:
+        tuple: (optimal moves, vehicle tuples), or None if no position of the
+        component can reach the goal.
+    """
+    database = DistanceDatabase.build(size, vehicles, move_model)
+    best = None
+    for key, distance in zip(database.keys, database.distances):
+        if distance == database.unsolvable:
+            continue
+        # Hoà thì lấy khoá nhỏ nhất để kết quả không phụ thuộc thứ tự duyệt
+        if best is None or distance > best[0]:
+            best = (distance, key)
+    if best is None:
+        return None
+    distance, key = best
+    return distance, database.spec.decode(key)
+
+
+def sample_job(seed, samples, size, vehicle_range, move_model, min_moves):
+    """
+    Sample ``samples`` boards in a worker process.
+
+    Returns:
+        list: (moves, canonical hash, canonical vehicles) for every puzzle of
+        at least ``min_moves`` moves. The same puzzle can appear more than
+        once; the caller deduplicates.
+    """
+    rng = random.Random(seed)
+    found = []
+    for _ in range(samples):
+        vehicles = random_board(rng, size, vehicle_range)
+        hardest = hardest_in_component(size, vehicles, move_model)
+        if hardest is None or hardest[0] < min_moves:
+            continue
+        moves, vehicles = hardest
+        vehicles = canonical(vehicles)
+        found.append((moves, board_hash(size, vehicles), vehicles))
+    return found
+
+
+def generate(samples, keep, size=(6, 6), vehicle_range=(8, 13), move_model="step",
+             min_moves=1, workers=None, chunk=50, seed=None, log=sys.stderr):
+    """
+    Sample boards in parallel and return the ``keep`` hardest distinct puzzles.
+
+    Returns:
+        list: (moves, hash, vehicles) sorted from hardest to easiest.
+    """
+    seed = random.randrange(1 << 32) if seed is None else seed
+    best = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(sample_job, seed + start, min(chunk, samples - start),
+                            size, vehicle_range, move_model, min_moves)
+            for start in range(0, samples, chunk)
+        ]
+        done = 0
+        for future in as_completed(futures):
+            for moves, key, vehicles in future.result():
+                best[key] = (moves, key, vehicles)
+            done += 1
+            print(f"\r{done}/{len(futures)} chunks, {len(best)} distinct puzzles", end="", file=log)
+    print(file=log)
+    return heapq.nlargest(keep, best.values(), key=lambda puzzle: (puzzle[0], puzzle[1]))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate hard Rush Hour puzzles.")
+    parser.add_argument("-n", "--samples", type=int, default=1000, help="random boards to sample")
+    parser.add_argument("-k", "--keep", type=int, default=10, help="hardest puzzles to write")
+    parser.add_argument("-s", "--size", type=int, nargs=2, default=[6, 6], metavar=("ROWS", "COLS"))
+    parser.add_argument("--vehicles", type=int, nargs=2, default=[8, 13], metavar=("MIN", "MAX"),
+                        help="number of vehicles besides X (default: 8 13)")
+    parser.add_argument("-m", "--move-model", choices=["step", "slide"], default=SETTINGS["MOVE_MODEL"])
+    parser.add_argument("--min-moves", type=int, default=1, help="discard puzzles shorter than this")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-o", "--output", default="generated", help="output directory (default: generated)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.time()
+    puzzles = generate(args.samples, args.keep, tuple(args.size), tuple(args.vehicles),
+                       args.move_model, args.min_moves, args.workers, seed=args.seed)
+
+    os.makedirs(args.output, exist_ok=True)
+    for moves, key, vehicles in puzzles:
+        path = os.path.join(args.output, f"{args.move_model}_{moves:03d}_{key[:10]}.json")
+        with open(path, "w") as f:
+            json.dump(to_map(args.size, vehicles, moves, args.move_model), f, indent=2)
+        print(f"{path}: {moves} moves", file=sys.stderr)
+    print(f"{len(puzzles)} puzzles in {time.time() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
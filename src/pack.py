@@ -0,0 +1,65 @@
+"""
+Convert between JSON map files and binary puzzle packs.
+
+Run from the ``src`` directory:
+
+    python pack.py create puzzles.rhpk maps/ generated/
+    python pack.py extract puzzles.rhpk -o unpacked/
+    python pack.py info puzzles.rhpk
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from batch import find_maps
+from rushhour.pack import PuzzlePack, pack_maps, unpack_maps
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert between JSON maps and binary puzzle packs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="pack JSON maps into one file")
+    create.add_argument("output", help="pack file to write")
+    create.add_argument("maps", nargs="+", help="map directories or glob patterns")
+    create.add_argument("--slots", type=int, default=None,
+                        help="vehicle slots per record (default: rows * cols / 2)")
+
+    extract = commands.add_parser("extract", help="write every puzzle of a pack as a JSON map")
+    extract.add_argument("pack")
+    extract.add_argument("-o", "--output", default="unpacked", help="output directory (default: unpacked)")
+
+    info = commands.add_parser("info", help="describe a pack")
+    info.add_argument("pack")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.time()
+
+    if args.command == "create":
+        map_paths = find_maps(args.maps)
+        if not map_paths:
+            print("No map files found", file=sys.stderr)
+            return 1
+        count = pack_maps(map_paths, args.output, args.slots)
+        print(f"{count} puzzles -> {args.output} ({os.path.getsize(args.output)} bytes), "
+              f"{time.time() - start:.2f}s", file=sys.stderr)
+
+    elif args.command == "extract":
+        count = unpack_maps(args.pack, args.output)
+        print(f"{count} maps -> {args.output}, {time.time() - start:.2f}s", file=sys.stderr)
+
+    else:
+        with PuzzlePack(args.pack) as pack:
+            print(f"{len(pack)} puzzles, {pack.size[0]}x{pack.size[1]}, "
+                  f"{pack.slots} vehicle slots, {pack.record.size} bytes per record")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
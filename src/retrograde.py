@@ -0,0 +1,63 @@
+"""
+Retrograde analysis CLI.
+
+Takes the vehicle set of a map (lengths, orientations and lanes; the current
+positions are ignored), analyses every solvable placement of it and prints
+the hardest positions of each connected component. Run from the ``src``
+directory:
+
+    python retrograde.py maps/map1.json -m step --top 5
+    python retrograde.py maps/map1.json -o hardest/
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import SETTINGS
+from core import load_map_from_json
+from generate import to_map
+from rushhour.retrograde import RetrogradeAnalysis
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Find the hardest positions of a Rush Hour vehicle set.")
+    parser.add_argument("map", help="map file whose vehicle set is analysed")
+    parser.add_argument("-m", "--move-model", choices=["step", "slide"], default=SETTINGS["MOVE_MODEL"])
+    parser.add_argument("--top", type=int, default=10, help="components to print, deepest first (default: 10)")
+    parser.add_argument("-o", "--output", help="write one map per printed component into this directory")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    board = load_map_from_json(args.map)
+    vehicles = board.serialize()
+    analysis = RetrogradeAnalysis(board.size, vehicles, args.move_model)
+    print(f"{analysis.space} rank slots, {analysis.memory() / 1024:.1f} KiB of bit arrays", file=sys.stderr)
+
+    start = time.time()
+    components = list(analysis.components())
+    solvable = sum(component.states for component in components)
+    print(f"{len(components)} solvable components, {solvable} states, {time.time() - start:.2f}s",
+          file=sys.stderr)
+
+    components.sort(key=lambda component: (-component.depth, -component.states))
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    for number, component in enumerate(components[:args.top]):
+        print(f"depth {component.depth:3d}: {component.states} states, {component.goals} goals, "
+              f"{len(component.hardest)} hardest")
+        if args.output:
+            vehicles = analysis.spec.decode(component.hardest[0])
+            path = os.path.join(args.output, f"{args.move_model}_{component.depth:03d}_{number}.json")
+            with open(path, "w") as f:
+                json.dump(to_map(board.size, vehicles, component.depth, args.move_model), f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
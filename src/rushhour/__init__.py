@@ -0,0 +1,3 @@
+from .state import BoardSpec, State
+
+__all__ = ["BoardSpec", "State"]
\ No newline at end of file
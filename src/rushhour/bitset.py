@@ -0,0 +1,76 @@
+"""
+Fixed-size bit arrays for large sets of small integers.
+
+One bit per possible member instead of a Python ``set`` entry, which costs
+tens of bytes per element, so a whole state space can be marked in memory.
+The bytes are shared with a NumPy view, so a whole BFS layer of indices can
+be tested and marked with a few array operations.
+"""
+import numpy as np
+
+
+class BitSet:
+    """
+    Set of integers in ``range(size)`` backed by a ``bytearray``.
+
+    Args:
+        size (int): Number of representable members.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.bits = bytearray((size + 7) >> 3)
+        # Cùng vùng nhớ với self.bits, không sao chép
+        self.array = np.frombuffer(self.bits, dtype=np.uint8)
+
+    def __contains__(self, index):
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def add(self, index):
+        """
+        Set bit ``index``.
+
+        Returns:
+            bool: True if the bit was clear before, False if it was already set.
+        """
+        byte = index >> 3
+        bit = 1 << (index & 7)
+        if self.bits[byte] & bit:
+            return False
+        self.bits[byte] |= bit
+        return True
+
+    def discard(self, index):
+        self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def contains_many(self, indices):
+        """Membership of every index of a NumPy integer array, as a boolean array."""
+        indices = np.asarray(indices, dtype=np.uint64)
+        bits = np.left_shift(1, indices & np.uint64(7)).astype(np.uint8)
+        return (self.array[indices >> np.uint64(3)] & bits) != 0
+
+    def add_many(self, indices):
+        """
+        Set every bit of a NumPy integer array.
+
+        Returns:
+            numpy.ndarray: True where the bit was clear before; an index that
+            repeats within ``indices`` counts as new only at its first position.
+        """
+        indices = np.asarray(indices, dtype=np.uint64)
+        unique, first = np.unique(indices, return_index=True)
+        fresh = ~self.contains_many(unique)
+        unique = unique[fresh]
+        # Nhiều bit có thể rơi vào cùng một byte, nên phải dùng .at thay vì gán theo chỉ số
+        np.bitwise_or.at(self.array, unique >> np.uint64(3),
+                         np.left_shift(1, unique & np.uint64(7)).astype(np.uint8))
+        new = np.zeros(len(indices), dtype=bool)
+        new[first[fresh]] = True
+        return new
+
+    def __len__(self):
+        return int(np.bitwise_count(self.array).sum(dtype=np.int64))
+
+    @property
+    def nbytes(self):
+        return len(self.bits)
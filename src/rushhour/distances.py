@@ -0,0 +1,189 @@
+"""
+Exact distance-to-goal databases.
+
+A database covers the whole component reachable from a map's initial board
+under one move model. Every state is stored as its position vector in a
+sorted ``array('Q')`` next to an array of distances, so a lookup is a binary
+search and the file is just a small JSON header followed by the two raw
+arrays.
+"""
+import json
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+from rushhour.state import BoardSpec, board_hash
+
+MAGIC = b"RHDB1\n"
+
+
+class DistanceDatabase:
+    """
+    Sorted-array index from position vector to exact distance to the nearest goal.
+
+    Keys are position vectors of a ``BoardSpec`` whose vehicles are sorted by
+    name, so the database does not depend on the order a map file lists its
+    vehicles in. ``key_mapper`` converts position vectors of any other spec for
+    the same board.
+
+    Args:
+        size (tuple): Board dimensions as (rows, cols).
+        vehicles (list): Initial (row, col, length, orientation, name) tuples.
+        move_model (str): Move model the distances were computed under.
+        keys (array): Sorted position vectors, typecode 'Q'.
+        distances (array): Distance of each key; ``unsolvable`` marks states
+            with no goal in their component.
+    """
+
+    def __init__(self, size, vehicles, move_model, keys, distances):
+        self.size = tuple(size)
+        self.vehicles = sorted((tuple(v) for v in vehicles), key=lambda v: v[4])
+        self.move_model = move_model
+        self.board_hash = board_hash(self.size, self.vehicles)
+        self.spec = BoardSpec(self.size, self.vehicles)
+        self.keys = keys
+        self.distances = distances
+        self.unsolvable = (1 << (8 * distances.itemsize)) - 1
+
+    @classmethod
+    def build(cls, size, vehicles, move_model="step"):
+        """
+        Enumerate the component reachable from ``vehicles`` and solve it exactly.
+
+        A BFS from the initial state collects every reachable state, then a
+        multi-source BFS from all goal states in that component assigns each
+        state its distance. Moves are reversible, so both passes use the same
+        successor function as ``BaseSolver.expand``.
+
+        Raises:
+            ValueError: If a position vector does not fit in 64 bits.
+        """
+        vehicles = sorted((tuple(v) for v in vehicles), key=lambda v: v[4])
+        spec = BoardSpec(size, vehicles)
+        if spec.count * spec.bits > 64:
+            raise ValueError("Board too large for a 64-bit distance database")
+        moves = spec.move_table(move_model)
+
+        start = spec.encode(vehicles)
+        reachable = [start]
+        seen = {start.positions}
+        for state in reachable:
+            for child in spec.successors(state, moves):
+                if child.positions not in seen:
+                    seen.add(child.positions)
+                    reachable.append(child)
+
+        found = {}
+        queue = deque()
+        for state in reachable:
+            if spec.is_goal(state):
+                found[state.positions] = 0
+                queue.append(state)
+        while queue:
+            state = queue.popleft()
+            distance = found[state.positions] + 1
+            for child in spec.successors(state, moves):
+                if child.positions not in found:
+                    found[child.positions] = distance
+                    queue.append(child)
+
+        deepest = max(found.values(), default=0)
+        typecode = 'B' if deepest < 0xFF else 'H' if deepest < 0xFFFF else 'I'
+        unsolvable = (1 << (8 * array(typecode).itemsize)) - 1
+
+        keys = array('Q', sorted(seen))
+        distances = array(typecode, (found.get(key, unsolvable) for key in keys))
+        return cls(size, vehicles, move_model, keys, distances)
+
+    @staticmethod
+    def path_for(directory, board_hash, move_model):
+        return os.path.join(directory, f"{board_hash}.{move_model}.rhdb")
+
+    def save(self, path):
+        header = json.dumps({
+            "size": list(self.size),
+            "vehicles": [list(v) for v in self.vehicles],
+            "move_model": self.move_model,
+            "count": len(self.keys),
+            "distance_type": self.distances.typecode,
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            self.keys.tofile(f)
+            self.distances.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a database written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a distance database.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a distance database: {path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            keys = array('Q')
+            keys.fromfile(f, header["count"])
+            distances = array(header["distance_type"])
+            distances.fromfile(f, header["count"])
+        return cls(header["size"], header["vehicles"], header["move_model"], keys, distances)
+
+    @classmethod
+    def find(cls, directory, board_hash, move_model):
+        """Load the database for a board if one was built into ``directory``, else None."""
+        path = cls.path_for(directory, board_hash, move_model)
+        if not os.path.exists(path):
+            return None
+        return cls.load(path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, key):
+        """
+        Distance for a position vector in this database's vehicle order.
+
+        Returns:
+            int: Moves to the nearest goal, ``float('inf')`` if no goal is
+            reachable, or None if the state is not in the database.
+        """
+        index = bisect_left(self.keys, key)
+        if index == len(self.keys) or self.keys[index] != key:
+            return None
+        distance = self.distances[index]
+        return float('inf') if distance == self.unsolvable else distance
+
+    def key_mapper(self, spec):
+        """
+        Return a function converting ``spec`` position vectors into database keys.
+
+        Args:
+            spec (BoardSpec): Spec of the same board, vehicles in any order.
+        """
+        if spec.names == self.spec.names:
+            return lambda positions: positions
+
+        field_mask = spec.field_mask
+        fields = [
+            (spec.shifts[spec.names.index(name)], shift)
+            for name, shift in zip(self.spec.names, self.spec.shifts)
+        ]
+
+        def mapper(positions):
+            key = 0
+            for source, target in fields:
+                key |= ((positions >> source) & field_mask) << target
+            return key
+        return mapper
+
+    def distance(self, vehicles):
+        """Distance for a board given as (row, col, length, orientation, name) tuples."""
+        by_name = {v[4]: v for v in vehicles}
+        return self.lookup(self.spec.encode(by_name[name] for name in self.spec.names).positions)
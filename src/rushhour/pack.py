@@ -0,0 +1,292 @@
+"""
+Binary puzzle packs.
+
+A pack stores many puzzles of one board size in a single file instead of
+one JSON file each. The file is a fixed header, one fixed-width record per
+puzzle, a string table of puzzle names and an offset index into that table:
+
+    header   MAGIC, rows, cols, vehicle slots per record, record size,
+             puzzle count, string table offset, offset index offset
+    records  count * record size bytes
+    names    UTF-8 names, concatenated
+    index    (count + 1) little-endian uint64 offsets into the string table
+
+A record holds the vehicle count, the move model and optimal length when
+known (``moves``/``move_model`` of the JSON schema), and three bytes per
+vehicle slot: the one-letter name, ``row << 4 | col`` and
+``length << 1 | vertical``. Unused slots are zero. Since records are
+fixed-width, puzzle ``i`` sits at a computed offset and needs no lookup.
+
+``PuzzlePack`` reads a pack through ``mmap``: records are decoded straight
+from the mapping with ``struct`` and the offset index is a ``memoryview``
+cast over it, so opening a pack of millions of puzzles reads nothing up
+front and iterating never copies the file.
+"""
+from array import array
+import json
+import mmap
+import os
+import struct
+
+from rushhour.state import BoardSpec
+from rushhour.validation import validate_map
+
+MAGIC = b"RHPK1\n"
+HEADER = struct.Struct("<6sBBBxHQQQ")
+# Mã mô hình nước đi trong bản ghi; 0 là chưa biết độ dài lời giải
+MOVE_MODELS = (None, "step", "slide")
+UNKNOWN_MOVES = 0xFFFF
+
+
+def record_struct(slots):
+    """Record layout for ``slots`` vehicles: count, move model, moves, then one 3-byte field per slot."""
+    return struct.Struct("<BBH" + "3s" * slots)
+
+
+def encode_vehicle(row, col, length, orientation, name):
+    """The 3-byte slot of one vehicle: name, ``row << 4 | col``, ``length << 1 | vertical``."""
+    return bytes((ord(name), row << 4 | col, length << 1 | (orientation == 'V')))
+
+
+def decode_vehicle(slot):
+    """Inverse of ``encode_vehicle``."""
+    name, cell, shape = slot
+    return (cell >> 4, cell & 15, shape >> 1, 'V' if shape & 1 else 'H', chr(name))
+
+
+def map_vehicles(map_data):
+    """(row, col, length, orientation, name) tuples of a map in the JSON schema."""
+    return tuple((v["row"], v["col"], v["length"], v["orientation"], v["name"]) for v in map_data["vehicles"])
+
+
+class PackWriter:
+    """
+    Stream puzzles into a new pack.
+
+    Args:
+        path (str): Output file.
+        size (tuple): Board dimensions shared by every puzzle, at most 15 x 15.
+        slots (int): Vehicle slots per record; the most vehicles a puzzle may have.
+    """
+
+    def __init__(self, path, size, slots):
+        rows, cols = size
+        if not (0 < rows <= 15 and 0 < cols <= 15):
+            raise ValueError(f"Pack boards must be at most 15x15, got {rows}x{cols}")
+        self.path = path
+        self.size = (rows, cols)
+        self.slots = slots
+        self.record = record_struct(slots)
+        self.names = bytearray()
+        self.offsets = array('Q', [0])
+        self.count = 0
+        self.file = open(path, "wb")
+        self.file.write(bytes(HEADER.size))
+
+    def add(self, map_data, name=""):
+        """
+        Append one puzzle in the JSON map schema.
+
+        Raises:
+            InvalidMapError: If the puzzle is not a valid map.
+            ValueError: If the puzzle does not fit the pack's size or slots.
+        """
+        validate_map(map_data)
+        if tuple(map_data["size"]) != self.size:
+            raise ValueError(f"Puzzle {name!r} is {map_data['size']}, pack is {list(self.size)}")
+        vehicles = map_vehicles(map_data)
+        if len(vehicles) > self.slots:
+            raise ValueError(f"Puzzle {name!r} has {len(vehicles)} vehicles, pack has {self.slots} slots")
+
+        moves = map_data.get("moves")
+        model = MOVE_MODELS.index(map_data.get("move_model")) if moves is not None else 0
+        fields = [len(vehicles), model, UNKNOWN_MOVES if moves is None else moves]
+        for vehicle in vehicles:
+            if len(vehicle[4]) != 1 or not vehicle[4].isascii():
+                raise ValueError(f"Puzzle {name!r}: vehicle names must be one ASCII character, got {vehicle[4]!r}")
+            fields.append(encode_vehicle(*vehicle))
+        fields.extend([bytes(3)] * (self.slots - len(vehicles)))
+        self.file.write(self.record.pack(*fields))
+
+        self.names += name.encode("utf-8")
+        self.offsets.append(len(self.names))
+        self.count += 1
+
+    def close(self):
+        if self.file.closed:
+            return
+        names_offset = HEADER.size + self.count * self.record.size
+        index_offset = names_offset + len(self.names)
+        self.file.write(self.names)
+        self.offsets.tofile(self.file)
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.size[0], self.size[1], self.slots, self.record.size,
+                                    self.count, names_offset, index_offset))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PuzzlePack:
+    """
+    Memory-mapped, read-only view of a pack.
+
+    Raises:
+        ValueError: If the file is not a puzzle pack.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size or self.mm[:len(MAGIC)] != MAGIC:
+            self.mm.close()
+            raise ValueError(f"Not a puzzle pack: {path}")
+
+        (_, rows, cols, self.slots, record_size,
+         self.count, names_offset, index_offset) = HEADER.unpack_from(self.mm)
+        self.size = (rows, cols)
+        self.record = record_struct(self.slots)
+        if record_size != self.record.size:
+            self.mm.close()
+            raise ValueError(f"Corrupt puzzle pack: {path}")
+
+        view = memoryview(self.mm)
+        self.records = view[HEADER.size:names_offset]
+        self.names = view[names_offset:index_offset]
+        self.offsets = view[index_offset:index_offset + 8 * (self.count + 1)].cast('Q')
+        # Bảng giải mã ô xe 3 byte -> tuple, điền dần khi gặp
+        self.vehicle_cache = {}
+        # BoardSpec theo bố cục làn xe: các câu đố liên tiếp thường có cùng bố cục
+        self.spec_cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def decode(self, fields):
+        """(vehicles, moves, move_model) of one unpacked record."""
+        cache = self.vehicle_cache
+        vehicles = []
+        for slot in fields[3:3 + fields[0]]:
+            vehicle = cache.get(slot)
+            if vehicle is None:
+                vehicle = cache[slot] = decode_vehicle(slot)
+            vehicles.append(vehicle)
+        moves = None if fields[2] == UNKNOWN_MOVES else fields[2]
+        return tuple(vehicles), moves, MOVE_MODELS[fields[1]]
+
+    def __getitem__(self, index):
+        """Vehicle tuples of puzzle ``index``."""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.decode(self.record.unpack_from(self.records, index * self.record.size))[0]
+
+    def __iter__(self):
+        """Vehicle tuples of every puzzle, decoded in place from the mapping."""
+        decode = self.decode
+        for fields in self.record.iter_unpack(self.records):
+            yield decode(fields)[0]
+
+    def name(self, index):
+        return str(self.names[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+
+    def map_data(self, index):
+        """Puzzle ``index`` in the JSON map schema."""
+        vehicles, moves, move_model = self.decode(self.record.unpack_from(self.records, index * self.record.size))
+        data = {
+            "size": list(self.size),
+            "vehicles": [
+                {"name": name, "row": row, "col": col, "length": length, "orientation": orientation}
+                for row, col, length, orientation, name in vehicles
+            ],
+        }
+        if moves is not None:
+            data["moves"] = moves
+            data["move_model"] = move_model
+        return data
+
+    def boards(self):
+        """A validated ``core.Board`` for every puzzle."""
+        from core.map_loader import board_from_vehicles
+
+        for vehicles in self:
+            yield board_from_vehicles(self.size, vehicles)
+
+    def states(self):
+        """
+        Solver states for every puzzle.
+
+        Yields:
+            tuple: (BoardSpec, State) with vehicles in record order. Puzzles
+            that share a vehicle layout (same vehicles and lanes) share the
+            spec object.
+        """
+        cache = self.spec_cache
+        for vehicles in self:
+            layout = tuple((v[0] if v[3] == 'H' else v[1], v[2], v[3], v[4]) for v in vehicles)
+            spec = cache.get(layout)
+            if spec is None:
+                if len(cache) >= 1024:
+                    cache.clear()
+                spec = cache[layout] = BoardSpec(self.size, vehicles)
+            yield spec, spec.encode(vehicles)
+
+    def close(self):
+        # Phải giải phóng các memoryview trước khi đóng mmap
+        self.offsets.release()
+        self.names.release()
+        self.records.release()
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def pack_maps(map_paths, output, slots=None):
+    """
+    Convert JSON map files into one pack; names are the files' base names.
+
+    Args:
+        map_paths (list): JSON map files, all of the same board size.
+        output (str): Pack file to write.
+        slots (int): Vehicle slots per record (default: rows * cols // 2, as
+            every vehicle covers at least two cells).
+
+    Returns:
+        int: Number of puzzles written.
+    """
+    def read(path):
+        with open(path, "r") as f:
+            return json.load(f)
+
+    if not map_paths:
+        raise ValueError("No maps to pack")
+    first = read(map_paths[0])
+    rows, cols = first["size"]
+    with PackWriter(output, (rows, cols), slots or rows * cols // 2) as writer:
+        for path in map_paths:
+            writer.add(read(path), os.path.basename(path))
+    return len(map_paths)
+
+
+def unpack_maps(pack_path, directory):
+    """
+    Write every puzzle of a pack back as a JSON map file named after it.
+
+    Returns:
+        int: Number of files written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with PuzzlePack(pack_path) as pack:
+        for index in range(len(pack)):
+            name = pack.name(index) or f"puzzle{index}.json"
+            with open(os.path.join(directory, name), "w") as f:
+                json.dump(pack.map_data(index), f, indent=2)
+        return len(pack)
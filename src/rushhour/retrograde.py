@@ -0,0 +1,162 @@
+"""
+Retrograde analysis of a whole lane configuration.
+
+Vehicles keep their lanes, so a set of vehicles (length, orientation and
+lane each) on a board of a given size defines a finite state space: every
+non-overlapping combination of lane positions. Starting from every goal
+placement, a backward breadth-first search labels each solvable state with its
+distance to the nearest goal, one connected component at a time, and reports
+the states farthest from the exit in each component. Those are the hardest
+puzzles the configuration contains.
+
+Vehicles sharing a lane keep their order and never overlap, so the lane
+positions are not ranked independently. Each lane's vehicles are ranked
+jointly among that lane's non-overlapping placements, and a state's rank
+combines the per-lane ranks in mixed radix. The rank space is therefore the
+product of the per-lane placement counts. That is much smaller than the
+product of every vehicle's position count: a row holding three length-2 cars
+has 12 placements, not 25. The visited sets are ``BitSet``s over that rank
+space rather than Python sets. The search runs a layer at a time on
+``uint64`` arrays, with ``LayerExpander`` generating the moves and
+``BitSet.add_many`` filtering out seen states.
+"""
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+
+from rushhour.bitset import BitSet
+from rushhour.layers import LayerExpander
+from rushhour.state import BoardSpec
+
+
+class Component(NamedTuple):
+    states: int
+    goals: int
+    depth: int
+    hardest: tuple
+
+
+class RetrogradeAnalysis:
+    """
+    Exhaustive distance-to-goal analysis for one vehicle set.
+
+    Args:
+        size (tuple): Board dimensions as (rows, cols).
+        vehicles (iterable): (row, col, length, orientation, name) tuples;
+            only the lanes matter, not the current positions.
+        move_model (str): "step" or "slide".
+    """
+
+    def __init__(self, size, vehicles, move_model="step"):
+        self.spec = BoardSpec(size, vehicles)
+        self.move_model = move_model
+        self.expander = LayerExpander(self.spec, move_model)
+        spec = self.spec
+
+        # Xe cùng hàng (ngang) hoặc cùng cột (dọc) chia nhau một làn
+        lanes = {}
+        for i in range(spec.count):
+            lanes.setdefault((spec.orientations[i], spec.lanes[i]), []).append(i)
+
+        # Mỗi làn: (các xe, trọng số mã hỗn hợp trong làn, bảng mã -> hạng đặc của làn, trọng số của làn)
+        self.lanes = []
+        space = 1
+        for members in lanes.values():
+            local_radices = []
+            codes = 1
+            for i in members:
+                local_radices.append(codes)
+                codes *= spec.limits[i] + 1
+            table = [0] * codes
+            count = 0
+            for placement in product(*(range(spec.limits[i] + 1) for i in members)):
+                occupied = 0
+                for i, position in zip(members, placement):
+                    mask = spec.masks[i][position]
+                    if occupied & mask:
+                        break
+                    occupied |= mask
+                else:
+                    table[sum(p * r for p, r in zip(placement, local_radices))] = count
+                    count += 1
+            self.lanes.append((members, local_radices, table, space))
+            space *= count
+        self.space = space
+        self.lane_tables = [np.array(table, dtype=np.uint64) for _, _, table, _ in self.lanes]
+
+    def rank(self, positions):
+        """Map a position vector to its index in ``range(self.space)``."""
+        spec = self.spec
+        field_mask = spec.field_mask
+        index = 0
+        for members, local_radices, table, radix in self.lanes:
+            code = 0
+            for i, local_radix in zip(members, local_radices):
+                code += ((positions >> spec.shifts[i]) & field_mask) * local_radix
+            index += table[code] * radix
+        return index
+
+    def rank_layer(self, layer):
+        """``rank`` of every position vector of a ``uint64`` array."""
+        positions = self.expander.positions
+        index = np.zeros(len(layer), dtype=np.uint64)
+        for (members, local_radices, _, radix), table in zip(self.lanes, self.lane_tables):
+            code = np.zeros(len(layer), dtype=np.intp)
+            for i, local_radix in zip(members, local_radices):
+                code += positions(layer, i) * local_radix
+            index += table[code] * np.uint64(radix)
+        return index
+
+    def memory(self):
+        """Bytes used by the two bit arrays the analysis allocates."""
+        return 2 * ((self.space + 7) >> 3)
+
+    def components(self):
+        """
+        Analyse every component that contains a goal placement.
+
+        For each goal not yet seen, a flood fill collects the goals of its
+        component, then a multi-source BFS from those goals assigns distances
+        layer by layer. The last non-empty layer holds the hardest states.
+        States that cannot reach any goal are never visited.
+
+        Yields:
+            Component: Number of states and goals, maximal distance and the
+            position vectors at that distance, for each solvable component.
+        """
+        spec = self.spec
+        expand = self.expander.expand
+        rank_layer = self.rank_layer
+        seen = BitSet(self.space)
+        reached = BitSet(self.space)
+        x_shift = np.uint64(spec.shifts[spec.target]) if spec.target is not None else None
+
+        for goal in spec.goal_states():
+            if not seen.add(self.rank(goal.positions)):
+                continue
+
+            # Lượt 1: loang hết thành phần liên thông, gom các trạng thái đích
+            goals = [np.array([goal.positions], dtype=np.uint64)]
+            layer = goals[0]
+            states = 1
+            while len(layer):
+                children = np.unique(expand(layer)[0])
+                layer = children[seen.add_many(rank_layer(children))]
+                goals.append(layer[((layer >> x_shift) & np.uint64(spec.field_mask)) == spec.goal_position])
+                states += len(layer)
+
+            # Lượt 2: BFS nhiều nguồn từ mọi đích của thành phần
+            layer = np.concatenate(goals)
+            reached.add_many(rank_layer(layer))
+            count = len(layer)
+            depth = 0
+            while True:
+                children = np.unique(expand(layer)[0])
+                next_layer = children[reached.add_many(rank_layer(children))]
+                if not len(next_layer):
+                    break
+                layer = next_layer
+                depth += 1
+
+            yield Component(states, count, depth, tuple(sorted(int(positions) for positions in layer)))
@@ -0,0 +1,264 @@
+"""
+Compact search-state representation for Rush Hour boards.
+
+Vehicle data that never changes during a search (name, length, orientation
+and the lane a vehicle slides along) is stored once in a ``BoardSpec``. A
+search node is then just a ``State``: every vehicle's position along its lane
+packed into one integer, plus a bitmask of the occupied cells.
+
+Cell ``(row, col)`` maps to bit ``row * cols + col`` of the occupancy mask.
+Vehicle ``i`` stores its position in bits ``[i * bits, (i + 1) * bits)`` of the
+position vector, where the position is the column of a horizontal vehicle or
+the row of a vertical one.
+"""
+import hashlib
+from typing import NamedTuple
+
+
+class State(NamedTuple):
+    positions: int
+    occupied: int
+
+
+def board_hash(size, vehicles):
+    """
+    Canonical hash of a board.
+
+    Vehicles are sorted by name first, so the same board hashes equally
+    regardless of the order its map file lists the vehicles in.
+
+    Args:
+        size (tuple): Board dimensions as (rows, cols).
+        vehicles (iterable): (row, col, length, orientation, name) tuples.
+
+    Returns:
+        str: Hex SHA-1 digest.
+    """
+    canonical = repr((tuple(size), tuple(sorted((tuple(v) for v in vehicles), key=lambda v: v[4]))))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class BoardSpec:
+    """
+    Static description of a board shared by every search node.
+
+    Args:
+        size (tuple): Board dimensions as (rows, cols).
+        vehicles (iterable): Vehicles as (row, col, length, orientation, name)
+            tuples, in the same order as ``core.Board.serialize``.
+    """
+
+    def __init__(self, size, vehicles):
+        self.rows, self.cols = size
+        vehicles = tuple(vehicles)
+
+        self.count = len(vehicles)
+        self.names = tuple(v[4] for v in vehicles)
+        self.lengths = tuple(v[2] for v in vehicles)
+        self.orientations = tuple(v[3] for v in vehicles)
+        # Toạ độ cố định: hàng của xe ngang, cột của xe dọc
+        self.lanes = tuple(v[0] if v[3] == 'H' else v[1] for v in vehicles)
+
+        self.bits = max(self.rows, self.cols).bit_length()
+        self.field_mask = (1 << self.bits) - 1
+        self.shifts = tuple(i * self.bits for i in range(self.count))
+        self.limits = tuple(
+            (self.cols if orientation == 'H' else self.rows) - length
+            for length, orientation in zip(self.lengths, self.orientations)
+        )
+        # masks[i][p]: các ô mà xe i chiếm khi ở vị trí p
+        self.masks = tuple(
+            tuple(self._cells_mask(i, p) for p in range(max(limit, 0) + 1))
+            for i, limit in enumerate(self.limits)
+        )
+
+        # step_moves[i][p] / slide_moves[i][p]: các nước đi của xe i từ vị trí p,
+        # nhóm theo hướng; mỗi hướng là chuỗi (ô mới phải trống, delta vector
+        # vị trí, delta occupancy) theo khoảng cách tăng dần
+        self.step_moves = tuple(
+            tuple(self._move_chains(i, p, 1) for p in range(len(self.masks[i])))
+            for i in range(self.count)
+        )
+        self.slide_moves = tuple(
+            tuple(self._move_chains(i, p, None) for p in range(len(self.masks[i])))
+            for i in range(self.count)
+        )
+
+        self.target = self.names.index("X") if "X" in self.names else None
+        if self.target is not None and self.orientations[self.target] == 'H':
+            self.goal_position = self.limits[self.target]
+        else:
+            self.goal_position = None
+
+    def _cells_mask(self, index, position):
+        lane = self.lanes[index]
+        mask = 0
+        for offset in range(self.lengths[index]):
+            if self.orientations[index] == 'H':
+                row, col = lane, position + offset
+            else:
+                row, col = position + offset, lane
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                mask |= 1 << (row * self.cols + col)
+        return mask
+
+    def _move_chains(self, index, position, max_distance):
+        masks = self.masks[index]
+        current = masks[position]
+        chains = []
+        for direction in (-1, 1):
+            chain = []
+            target = position + direction
+            while 0 <= target <= self.limits[index]:
+                if max_distance is not None and len(chain) == max_distance:
+                    break
+                moved = masks[target]
+                chain.append((
+                    moved & ~masks[target - direction],
+                    (target - position) << self.shifts[index],
+                    current ^ moved,
+                ))
+                target += direction
+            if chain:
+                chains.append(tuple(chain))
+        return tuple(chains)
+
+    def move_table(self, move_model):
+        """
+        Return the move table for a move model.
+
+        Args:
+            move_model (str): "step" moves a vehicle one cell per action,
+                "slide" moves it any legal distance in one action.
+
+        Returns:
+            tuple: Table to pass to ``successors``.
+
+        Raises:
+            ValueError: If the move model is unknown.
+        """
+        if move_model == "step":
+            return self.step_moves
+        if move_model == "slide":
+            return self.slide_moves
+        raise ValueError(f"Unknown move model: {move_model}")
+
+    def successors(self, state, moves=None):
+        """
+        Yield every state reachable from ``state`` in one action.
+
+        Children are derived from the parent with precomputed deltas: a move
+        is legal when every cell it sweeps is free, and the child's position
+        vector and occupancy are the parent's plus/xor the move's delta.
+
+        Args:
+            state (State): The parent state.
+            moves (tuple): Table from ``move_table``; one-cell steps by default.
+        """
+        positions, occupied = state
+        field_mask = self.field_mask
+        if moves is None:
+            moves = self.step_moves
+        for shift, table in zip(self.shifts, moves):
+            for chain in table[(positions >> shift) & field_mask]:
+                for need, delta, flip in chain:
+                    if occupied & need:
+                        break
+                    yield State(positions + delta, occupied ^ flip)
+
+    def transitions(self, state, moves=None):
+        """
+        Yield every move from ``state`` with the vehicle it moves.
+
+        Same moves in the same order as ``successors``, so callers that need
+        to know what moved do not have to diff parent and child.
+
+        Yields:
+            tuple: (child State, index of the moved vehicle, cells moved).
+        """
+        positions, occupied = state
+        field_mask = self.field_mask
+        if moves is None:
+            moves = self.step_moves
+        for index, (shift, table) in enumerate(zip(self.shifts, moves)):
+            for chain in table[(positions >> shift) & field_mask]:
+                for distance, (need, delta, flip) in enumerate(chain, 1):
+                    if occupied & need:
+                        break
+                    yield State(positions + delta, occupied ^ flip), index, distance
+
+    def position(self, state, index):
+        """Return the lane position of vehicle ``index`` in ``state``."""
+        return (state.positions >> self.shifts[index]) & self.field_mask
+
+    def occupancy(self, positions):
+        """Build the occupancy bitmask for a packed position vector."""
+        occupied = 0
+        for i in range(self.count):
+            occupied |= self.masks[i][(positions >> self.shifts[i]) & self.field_mask]
+        return occupied
+
+    def encode(self, vehicles):
+        """
+        Pack vehicle tuples into a State.
+
+        Args:
+            vehicles (iterable): (row, col, length, orientation, name) tuples in
+                spec order.
+
+        Returns:
+            State: The compact state.
+        """
+        positions = 0
+        for i, (row, col, _, orientation, _) in enumerate(vehicles):
+            positions |= (col if orientation == 'H' else row) << self.shifts[i]
+        return State(positions, self.occupancy(positions))
+
+    def decode(self, positions):
+        """Unpack a position vector back into (row, col, length, orientation, name) tuples."""
+        vehicles = []
+        for i in range(self.count):
+            position = (positions >> self.shifts[i]) & self.field_mask
+            if self.orientations[i] == 'H':
+                row, col = self.lanes[i], position
+            else:
+                row, col = position, self.lanes[i]
+            vehicles.append((row, col, self.lengths[i], self.orientations[i], self.names[i]))
+        return tuple(vehicles)
+
+    def is_goal(self, state):
+        if self.goal_position is None:
+            return False
+        return self.position(state, self.target) == self.goal_position
+
+    def goal_states(self):
+        """
+        Lazily enumerate every legal placement with X at the exit.
+
+        Vehicles keep their lanes, so the goal set is every non-overlapping
+        combination of lane positions with X at its goal position. States are
+        generated by backtracking over the occupancy mask and yielded one at a
+        time, so callers only pay for as many as they consume.
+
+        Yields:
+            State: Each goal state.
+        """
+        if self.goal_position is None:
+            return
+
+        order = [i for i in range(self.count) if i != self.target]
+
+        def place(depth, positions, occupied):
+            if depth == len(order):
+                yield State(positions, occupied)
+                return
+            i = order[depth]
+            for position, mask in enumerate(self.masks[i]):
+                if not occupied & mask:
+                    yield from place(depth + 1, positions | position << self.shifts[i], occupied | mask)
+
+        yield from place(
+            0,
+            self.goal_position << self.shifts[self.target],
+            self.masks[self.target][self.goal_position],
+        )
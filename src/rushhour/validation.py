@@ -0,0 +1,123 @@
+"""
+Placement checks for maps in the ``maps/*.json`` dict format.
+
+All checks share one pass over the vehicles: each vehicle's cells become a
+bitmask (bit ``row * cols + col``) that is tested against the union of the
+masks before it, so bounds, overlaps and the target car are checked in
+O(vehicles) with no grid allocation.
+"""
+
+
+class InvalidMapError(ValueError):
+    """A map that cannot be played or searched."""
+
+
+def validate_vehicles(size, vehicles, require_target=True):
+    """
+    Check a board given as (row, col, length, orientation, name) tuples.
+
+    Args:
+        size (tuple): Board dimensions as (rows, cols).
+        vehicles (iterable): Vehicle tuples.
+        require_target (bool): Also require exactly one horizontal vehicle
+            named "X", without which no position is a goal.
+
+    Returns:
+        int: The occupancy mask of the board.
+
+    Raises:
+        InvalidMapError: On the first problem found.
+    """
+    rows, cols = size
+    if rows <= 0 or cols <= 0:
+        raise InvalidMapError(f"Board size must be positive, got {rows}x{cols}")
+
+    occupied = 0
+    names = set()
+    target = None
+    for row, col, length, orientation, name in vehicles:
+        if name in names:
+            raise InvalidMapError(f"Duplicate vehicle name {name!r}")
+        names.add(name)
+        if length < 1:
+            raise InvalidMapError(f"Vehicle {name!r} has length {length}")
+        if orientation == 'H':
+            if not (0 <= row < rows and 0 <= col and col + length <= cols):
+                raise InvalidMapError(f"Vehicle {name!r} lies outside the {rows}x{cols} board")
+            # length bit liền nhau bắt đầu từ ô (row, col)
+            mask = ((1 << length) - 1) << (row * cols + col)
+        elif orientation == 'V':
+            if not (0 <= col < cols and 0 <= row and row + length <= rows):
+                raise InvalidMapError(f"Vehicle {name!r} lies outside the {rows}x{cols} board")
+            # Cứ cách cols bit một bit, length lần
+            column = ((1 << (cols * length)) - 1) // ((1 << cols) - 1)
+            mask = column << (row * cols + col)
+        else:
+            raise InvalidMapError(f"Vehicle {name!r} has orientation {orientation!r}, expected 'H' or 'V'")
+        if occupied & mask:
+            raise InvalidMapError(f"Vehicle {name!r} overlaps another vehicle")
+        occupied |= mask
+        if name == "X":
+            target = orientation
+
+    if require_target:
+        if target is None:
+            raise InvalidMapError("Map has no target vehicle 'X'")
+        if target != 'H':
+            raise InvalidMapError("Target vehicle 'X' must be horizontal to reach the exit")
+    return occupied
+
+
+def map_vehicle_tuples(map_data):
+    """
+    Check the shape of a map dict and return its size and vehicle tuples.
+
+    Raises:
+        InvalidMapError: If a field is missing or has the wrong type.
+    """
+    try:
+        rows, cols = map_data["size"]
+        vehicles = [
+            (v["row"], v["col"], v["length"], v["orientation"], v["name"])
+            for v in map_data["vehicles"]
+        ]
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidMapError(f"Malformed map: {type(e).__name__}: {e}") from None
+
+    for value in (rows, cols):
+        if type(value) is not int:
+            raise InvalidMapError(f"Board size must be integers, got {map_data['size']!r}")
+    for vehicle in vehicles:
+        if any(type(value) is not int for value in vehicle[:3]) or not isinstance(vehicle[4], str):
+            raise InvalidMapError(f"Malformed vehicle {vehicle!r}")
+    return (rows, cols), vehicles
+
+
+def validate_map(map_data, require_target=True):
+    """
+    Check a map dict before it is turned into a ``Board`` or searched.
+
+    Raises:
+        InvalidMapError: If the map is malformed, a vehicle leaves the board
+            or overlaps another, or (with ``require_target``) X is missing or
+            vertical.
+    """
+    size, vehicles = map_vehicle_tuples(map_data)
+    validate_vehicles(size, vehicles, require_target)
+
+
+def check_valid_positions(map_data):
+    """
+    Check that every vehicle of a map dict fits on the board without overlapping.
+
+    Args:
+        map_data (dict): Map with "size" and "vehicles" entries.
+
+    Returns:
+        bool: True if all vehicles are inside the board and no cell is shared.
+    """
+    try:
+        validate_map(map_data, require_target=False)
+    except InvalidMapError:
+        return False
+    return True
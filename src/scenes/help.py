@@ -24,6 +24,8 @@ class HelpScreen:
             "- Click the Play button to start solving the puzzle.",
             "- Select the appropriate map and algorithm.",
             "- Watch the solving process and the result.",
+            "- Left/Right: step through the solution, Up/Down: change speed.",
+            "- Click or drag the progress bar to jump to any step.",
             "- Return to the main menu via ESC or the Back button.",
         ]
 
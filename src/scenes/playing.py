@@ -1,9 +1,10 @@
 import pygame
 from entities import Dropdown, Button
-from core import load_map_from_json
-from solvers import get_solver_class
+from core import MapCatalog, Playback
+from solvers import get_solver_class, SolverWorker, SolutionCache, SolverInterrupted
 from config import SETTINGS
-from utils import get_list_maps
+from rushhour.distances import DistanceDatabase
+from rushhour.state import board_hash
 
 class PlayingScreen:
     def __init__(self, screen, clock):
@@ -13,17 +14,44 @@ class PlayingScreen:
 
         self.board = None
         self.solver = None
+        self.worker = None
+        self.cache = SolutionCache.shared(SETTINGS["SOLUTION_CACHE"], SETTINGS["SOLUTION_CACHE_SIZE"])
+        self.cache_key = None
+        self.distance_db = None
         self.stats = {}
         
-        self.is_playing = False
-        self.current_step = 0
         self.solution_path = []
-        self.animation_timer = 0
-        self.animation_speed = 500
+        self.playback = None
+        # (tên xe, độ lệch theo ô) của nước đi đang chạy hoạt ảnh
+        self.motion = None
+        self.scrubbing = False
+        self.progress_bar_rect = pygame.Rect(450, 320, 200, 10)
         self.is_solved = False
         self.solving = False
         self.no_solution = False
 
+        # Font và chữ tĩnh chỉ tạo một lần thay vì mỗi khung hình
+        self.title_font = pygame.font.Font(None, 40)
+        self.stats_font = pygame.font.Font(None, 30)
+        self.small_font = pygame.font.Font(None, 24)
+        self.completion_font = pygame.font.Font(None, 28)
+        self.footer_font = pygame.font.Font(None, 26)
+        self.title_surface = self.title_font.render("Rush Hour Solver", True, (255, 255, 255))
+        self.footer_surface = self.footer_font.render("Press ESC to return to menu", True, (180, 180, 180))
+        self.text_cache = {}
+
+        # Vùng màn hình và khoá nội dung đã vẽ của từng vùng (xem render)
+        width, height = SETTINGS["WINDOW_SIZE"]
+        self.board_pos = (50, 80)
+        self.header_rect = pygame.Rect(0, 0, width, 50)
+        self.panel_rect = pygame.Rect(440, 50, width - 440, height - 100)
+        self.footer_rect = pygame.Rect(0, height - 50, width, 50)
+        self.drawn_keys = {}
+        self.drawn_expanded = False
+        self.full_redraw = True
+
+        # Danh sách map và dữ liệu đã đọc được giữ lại giữa các lần mở scene
+        self.catalog = MapCatalog.shared("maps")
         self.init_ui()
 
         self.prev_selected_map = "map1.json"
@@ -31,14 +59,18 @@ class PlayingScreen:
         
         self.load_game()
 
+    @property
+    def is_playing(self):
+        return self.playback is not None and self.playback.playing
+
     def init_ui(self):
         self.map_dropdown = Dropdown(
             SETTINGS["WINDOW_SIZE"][0] - 250, 10, 110, 30,
-            get_list_maps("maps")
+            self.catalog.names()
         )
         self.algo_dropdown = Dropdown(
-            SETTINGS["WINDOW_SIZE"][0] - 100, 10, 50, 30,
-            ["BFS", "DFS", "UCS", "A*"]
+            SETTINGS["WINDOW_SIZE"][0] - 130, 10, 80, 30,
+            SETTINGS["ALGORITHMS"]
         )
 
         self.play_button = Button(
@@ -59,15 +91,21 @@ class PlayingScreen:
     def load_game(self):
         selected_map_text = self.map_dropdown.get_selected()
 
-        board_data = load_map_from_json(f"maps/{selected_map_text}")
-        self.board = board_data
+        self.board = self.catalog.load(selected_map_text)
+        # Gợi ý tức thì nếu đã có cơ sở dữ liệu khoảng cách cho bản đồ này
+        self.distance_db = DistanceDatabase.find(
+            SETTINGS["DISTANCE_DB_DIR"],
+            board_hash(self.board.size, self.board.serialize()),
+            SETTINGS["MOVE_MODEL"]
+        )
         
+        self.cancel_solving()
         self.solver = None
         self.stats = {}
-        self.is_playing = False
-        self.current_step = 0
         self.solution_path = []
-        self.animation_timer = 0
+        self.playback = None
+        self.motion = None
+        self.scrubbing = False
         self.is_solved = False
         self.solving = False
         self.no_solution = False
@@ -83,35 +121,76 @@ class PlayingScreen:
             
         selected_algo_text = self.algo_dropdown.get_selected()
         solver_class = get_solver_class(selected_algo_text)
-        self.solver = solver_class(self.board)
         
         try:
-            self.stats = self.solver.solve()
-            self.solution_path = self.stats.get('path', [])
-            
-            if self.solution_path:
-                self.is_solved = True
-                self.play_button.text = "Play"
-            else:
-                self.no_solution = True
-                self.play_button.text = "No Solution"
-                
-        except Exception as e:
+            self.solver = solver_class(self.board, move_model=SETTINGS["MOVE_MODEL"])
+        except (ValueError, SolverInterrupted):
+            # Map không hợp lệ (InvalidMapError) hoặc bàn quá lớn cho solver này
+            self.solving = False
             self.no_solution = True
             self.play_button.text = "Error"
-            
-        finally:
+            return
+
+        self.cache_key = SolutionCache.make_key(self.solver, selected_algo_text)
+        cached = self.cache.get(self.cache_key)
+        if cached is not None:
             self.solving = False
+            self.set_result(cached)
+            return
+
+        # Giải trong luồng nền để vòng lặp pygame không bị chặn
+        self.worker = SolverWorker(self.solver)
+        self.worker.start()
+
+    def poll_solver(self):
+        if not self.worker or not self.worker.done():
+            return
+
+        worker = self.worker
+        self.worker = None
+        self.solving = False
+
+        if worker.error is not None or worker.result is None:
+            self.no_solution = True
+            self.play_button.text = "Error"
+            return
+
+        self.cache.put(self.cache_key, worker.result)
+        self.set_result(worker.result)
+
+    def set_result(self, stats):
+        self.stats = stats
+        self.solution_path = self.stats.get('path', [])
+
+        if self.solution_path:
+            self.is_solved = True
+            self.board.reset_to_initial_state()
+            self.playback = Playback(self.solution_path)
+            self.motion = None
+            self.play_button.text = "Play"
+        else:
+            self.no_solution = True
+            self.play_button.text = "No Solution"
+
+    def cancel_solving(self):
+        if self.worker:
+            self.worker.cancel()
+            self.worker = None
+        self.solving = False
 
     def run(self):
+        # Các scene khác đã vẽ đè lên màn hình
+        self.full_redraw = True
         while self.running:
             dt = self.clock.get_time()
             
             for event in pygame.event.get():
                 result = self.handle_event(event)
                 if result == "menu":
+                    self.cancel_solving()
                     return "menu"
                 elif result == "quit":
+                    self.cancel_solving()
                     return "quit"
 
             current_map = self.map_dropdown.get_selected()
@@ -122,6 +201,7 @@ class PlayingScreen:
                 self.prev_selected_map = current_map
                 self.prev_selected_algo = current_algo
 
+            self.poll_solver()
             self.update_animation(dt)
 
             self.render()
@@ -140,6 +220,8 @@ class PlayingScreen:
         if self.reset_button.handle_event(event):
             self.reset_animation()
 
+        self.handle_playback_event(event)
+
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return "menu"
@@ -150,6 +232,43 @@ class PlayingScreen:
                 
         return None
 
+    def handle_playback_event(self, event):
+        """Arrow keys step and change speed; the progress bar can be clicked and dragged to seek."""
+        playback = self.playback
+        if playback is None:
+            return
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RIGHT:
+                playback.pause()
+                playback.seek(playback.step + 1)
+            elif event.key == pygame.K_LEFT:
+                playback.pause()
+                # Đang ở giữa một nước đi thì lùi về đầu nước đó
+                playback.seek(playback.step if playback.fraction else playback.step - 1)
+            elif event.key == pygame.K_HOME:
+                playback.seek(0)
+            elif event.key == pygame.K_END:
+                playback.seek(len(playback))
+            elif event.key == pygame.K_UP:
+                playback.faster()
+            elif event.key == pygame.K_DOWN:
+                playback.slower()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.progress_bar_rect.inflate(0, 10).collidepoint(event.pos):
+                self.scrubbing = True
+                self.scrub_to(event.pos[0])
+        elif event.type == pygame.MOUSEMOTION and self.scrubbing:
+            self.scrub_to(event.pos[0])
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.scrubbing = False
+
+    def scrub_to(self, x):
+        bar = self.progress_bar_rect
+        fraction = min(max((x - bar.x) / bar.width, 0), 1)
+        self.playback.seek(round(fraction * len(self.playback)))
+
     def toggle_play(self):
         if self.solving:
             return
@@ -161,128 +280,197 @@ class PlayingScreen:
             self.solve_puzzle()
             return
             
-        if self.solution_path:
-            self.is_playing = not self.is_playing
-            self.play_button.text = "Pause" if self.is_playing else "Play"
+        if self.playback:
+            if self.playback.playing:
+                self.playback.pause()
+            else:
+                self.playback.play()
 
     def reset_animation(self):
-        self.is_playing = False
-        self.current_step = 0
-        self.animation_timer = 0
+        self.cancel_solving()
+        self.playback = None
+        self.motion = None
+        self.scrubbing = False
         self.is_solved = False
-        self.solving = False
         self.no_solution = False
         self.play_button.text = "Play"
         if self.board:
             self.board.reset_to_initial_state()
         
     def update_animation(self, dt):
-        if self.is_playing and self.solution_path:
-            self.animation_timer += dt
-            
-            if self.animation_timer >= self.animation_speed:
-                if self.current_step < len(self.solution_path):
-                    if self.board:
-                        self.board.apply_move(self.solution_path[self.current_step])
-                    self.current_step += 1
-                    self.animation_timer = 0
-                else:
-                    self.is_playing = False
-                    self.play_button.text = "Replay"
+        playback = self.playback
+        if playback is None or not self.board:
+            return
+
+        playback.update(dt)
+        self.motion = playback.sync(self.board)
+        if playback.playing:
+            self.play_button.text = "Pause"
+        else:
+            self.play_button.text = "Replay" if playback.finished else "Play"
+
+    def render_text(self, font, text, color):
+        """Render ``text`` once and reuse the surface while it stays on screen."""
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Bỏ cache khi quá lớn (ví dụ chữ thời gian đang giải thay đổi liên tục)
+            if len(self.text_cache) > 256:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
 
     def render(self):
-        self.screen.fill((30, 30, 30))
-        self.draw_header()
-        self.draw_main()
-        self.draw_footer()
-        pygame.display.flip()
+        """
+        Redraw only the screen regions whose content changed.
+
+        The screen is split into header, board and side panel; the footer
+        never changes and is only drawn on full repaints. Each region is
+        summarized by a key of what it shows; a region is repainted and
+        passed to ``pygame.display.update`` only when its key differs from
+        the one last drawn, so an idle screen costs no drawing at all.
+        Opening or closing a dropdown, whose list overlaps the other regions,
+        repaints everything.
+        """
+        board_key = self.board.serialize() if self.board else None
+        board_rect = self.board.get_rect(self.board_pos) if self.board else pygame.Rect(self.board_pos, (0, 0))
+        regions = [
+            ("header", self.header_rect, (
+                self.map_dropdown.selected_index, self.algo_dropdown.selected_index,
+                self.map_dropdown.expanded, self.algo_dropdown.expanded
+            ), self.draw_header),
+            ("board", board_rect, (id(self.board), board_key, self.motion), self.draw_board),
+            ("panel", self.panel_rect, self.panel_key(board_key), self.draw_panel),
+        ]
+
+        # Danh sách dropdown (đang mở hoặc vừa đóng) đè lên các vùng khác nên phải vẽ lại cả màn hình
+        expanded = self.map_dropdown.expanded or self.algo_dropdown.expanded
+        if (expanded or self.drawn_expanded) and any(
+                self.drawn_keys.get(name) != key for name, _, key, _ in regions):
+            self.full_redraw = True
+
+        if self.full_redraw:
+            self.screen.fill((30, 30, 30))
+            for name, rect, key, draw in regions[1:]:
+                draw()
+                self.drawn_keys[name] = key
+            self.draw_footer()
+            # Header vẽ sau cùng để danh sách dropdown nằm trên các vùng khác
+            self.draw_header()
+            self.drawn_keys["header"] = regions[0][2]
+            self.drawn_expanded = expanded
+            self.full_redraw = False
+            pygame.display.flip()
+            return
+
+        dirty = []
+        for name, rect, key, draw in regions:
+            if self.drawn_keys.get(name) == key:
+                continue
+            self.screen.set_clip(rect)
+            self.screen.fill((30, 30, 30), rect)
+            draw()
+            self.screen.set_clip(None)
+            self.drawn_keys[name] = key
+            dirty.append(rect)
+        if dirty:
+            pygame.display.update(dirty)
+
+    def panel_key(self, board_key):
+        return (
+            tuple(self.stats_labels()),
+            self.play_button.text, self.play_button_color(),
+            self.play_button.is_hovered, self.reset_button.is_hovered,
+            self.playback and (self.playback.step, self.playback.speed, self.playback.playing),
+            self.no_solution,
+            self.hint_text(board_key),
+        )
 
     def draw_header(self):
-        font = pygame.font.Font(None, 40)
-        title = font.render("Rush Hour Solver", True, (255, 255, 255))
-        self.screen.blit(title, (50, 10))
+        self.screen.blit(self.title_surface, (50, 10))
         self.map_dropdown.draw(self.screen)
         self.algo_dropdown.draw(self.screen)
 
-    def draw_main(self):
+    def draw_board(self):
         if self.board:
-            self.board.draw(self.screen, pos=(50, 80))
+            self.board.draw(self.screen, pos=self.board_pos, motion=self.motion)
+
+    def draw_panel(self):
         self.draw_stats()
         self.draw_controls()
+        self.draw_hint()
 
-    def draw_stats(self):
-        font = pygame.font.Font(None, 30)
-        
+    def stats_labels(self):
         algo_text = self.algo_dropdown.get_selected()
 
-        if self.solving:
-            labels = [
+        if self.solving and self.worker:
+            progress = self.worker.progress()
+            return [
                 f"Algorithm: {algo_text}",
-                "🔄 Solving puzzle...",
-                "Please wait...",
-                ""
+                f"Solving... {progress['elapsed']:.1f}s",
+                f"Frontier: {progress['frontier']}",
+                f"Expanded Nodes: {progress['expanded']}"
             ]
         elif self.no_solution:
-            labels = [
+            return [
                 f"Algorithm: {algo_text}",
                 "No solution found!",
                 "Try different algorithm",
                 "or check map validity"
             ]
         elif self.is_solved and self.stats:
-            labels = [
+            return [
                 f"Algorithm: {algo_text}",
-                f"Time: {self.stats['time']:.2f}s",
+                f"Time: {self.stats['time']:.2f}s" + (" (cached)" if self.stats.get('cached') else ""),
                 f"Space Used: {self.stats['space']}",
                 f"Expanded Nodes: {self.stats['expanded']}"
             ]
-        else:
-            labels = [
-                f"Algorithm: {algo_text}",
-                "Press Play to solve",
-                "",
-                ""
-            ]
-            
-        for i, text in enumerate(labels):
+        return [
+            f"Algorithm: {algo_text}",
+            "Press Play to solve",
+            "",
+            ""
+        ]
+
+    def draw_stats(self):
+        for i, text in enumerate(self.stats_labels()):
             if text:
                 color = (200, 200, 200)
-                txt = font.render(text, True, color)
+                txt = self.render_text(self.stats_font, text, color)
                 self.screen.blit(txt, (450, 100 + i * 40))
 
-    def draw_controls(self):
+    def play_button_color(self):
         if self.solving:
-            self.play_button.bg_color = (150, 150, 50)
+            return (150, 150, 50)
         elif self.no_solution:
-            self.play_button.bg_color = (180, 70, 70)
+            return (180, 70, 70)
         elif self.is_playing:
-            self.play_button.bg_color = (180, 100, 70)
+            return (180, 100, 70)
         elif self.is_solved:
-            self.play_button.bg_color = (70, 180, 70)
-        else:
-            self.play_button.bg_color = (70, 130, 180)
+            return (70, 180, 70)
+        return (70, 130, 180)
+
+    def draw_controls(self):
+        self.play_button.bg_color = self.play_button_color()
         
         self.play_button.draw(self.screen)
         self.reset_button.draw(self.screen)
         
-        if self.solution_path and not self.no_solution:
-            font = pygame.font.Font(None, 24)
-            progress_text = f"Step: {self.current_step}/{len(self.solution_path)}"
-            txt = font.render(progress_text, True, (200, 200, 200))
+        playback = self.playback
+        if playback and not self.no_solution:
+            progress_text = f"Step: {playback.step}/{len(playback)}   Speed: {playback.speed:g} moves/s"
+            txt = self.render_text(self.small_font, progress_text, (200, 200, 200))
             self.screen.blit(txt, (450, 300))
             
-            if self.current_step >= len(self.solution_path) and not self.is_playing:
-                completion_font = pygame.font.Font(None, 28)
+            if playback.finished and not playback.playing:
                 completion_text = "Result: Puzzle Solved!"
-                completion_txt = completion_font.render(completion_text, True, (100, 255, 100))
+                completion_txt = self.render_text(self.completion_font, completion_text, (100, 255, 100))
                 self.screen.blit(completion_txt, (450, 350))
             
-            if len(self.solution_path) > 0:
-                progress = self.current_step / len(self.solution_path)
-                bar_width = 200
-                bar_height = 10
-                bar_x = 450
-                bar_y = 320
+            if len(playback) > 0:
+                progress = playback.step / len(playback)
+                bar_x, bar_y, bar_width, bar_height = self.progress_bar_rect
                 
                 pygame.draw.rect(self.screen, (60, 60, 60), 
                                (bar_x, bar_y, bar_width, bar_height))
@@ -296,13 +484,28 @@ class PlayingScreen:
                                (bar_x, bar_y, bar_width, bar_height), 2)
         
         elif self.no_solution:
-            font = pygame.font.Font(None, 24)
-            txt = font.render("No moves to display", True, (255, 100, 100))
+            txt = self.render_text(self.small_font, "No moves to display", (255, 100, 100))
             self.screen.blit(txt, (450, 300))
 
+    def hint_text(self, board_key=None):
+        if not self.distance_db or not self.board:
+            return None
+
+        distance = self.distance_db.distance(board_key or self.board.serialize())
+        if distance is None:
+            return None
+        return "Unsolvable position" if distance == float('inf') else f"Moves to goal: {distance}"
+
+    def draw_hint(self):
+        text = self.hint_text()
+        if text is None:
+            return
+
+        txt = self.render_text(self.small_font, text, (200, 200, 120))
+        self.screen.blit(txt, (450, 400))
+
     def draw_footer(self):
-        font = pygame.font.Font(None, 26)
-        msg = font.render("Press ESC to return to menu", True, (180, 180, 180))
+        msg = self.footer_surface
         self.screen.blit(
             msg,
             (
@@ -1,17 +1,45 @@
+from solvers.base_solver import SolverInterrupted, SolverTimeout, SolverCancelled
 from solvers.bfs_solver import BFSSolver
 from solvers.dfs_solver import DFSSolver
 from solvers.ucs_solver import UCSSolver
 from solvers.astar_solver import AStarSolver
+from solvers.bidirectional_solver import BidirectionalBFSSolver
+from solvers.ida_solver import IDAStarSolver, IDDFSSolver
+from solvers.vectorized_bfs_solver import VectorizedBFSSolver
+from solvers.parallel_bfs_solver import ParallelBFSSolver
+from solvers.worker import SolverWorker
+from solvers.cache import SolutionCache
+from solvers.visited import (
+    VisitedStore, DictStore, PackedHashStore, BloomStore, VISITED_STORES, get_visited_store,
+    parse_visited_store
+)
+from solvers.observers import (
+    SolverObserver, ObserverGroup, CounterObserver, HistogramObserver, ProfilingObserver
+)
+
+SOLVERS = {
+    "BFS": BFSSolver,
+    "DFS": DFSSolver,
+    "UCS": UCSSolver,
+    "A*": AStarSolver,
+    "BIBFS": BidirectionalBFSSolver,
+    "IDA*": IDAStarSolver,
+    "IDDFS": IDDFSSolver,
+    "VBFS": VectorizedBFSSolver,
+    "PBFS": ParallelBFSSolver,
+}
+
+ALIASES = {
+    "ASTAR": "A*",
+    "BIDIRECTIONAL": "BIBFS",
+    "IDASTAR": "IDA*",
+    "VECTORIZED": "VBFS",
+    "PARALLEL": "PBFS",
+}
 
 def get_solver_class(name):
     name = name.upper()
-    if name == "BFS":
-        return BFSSolver
-    elif name == "DFS":
-        return DFSSolver
-    elif name == "UCS":
-        return UCSSolver
-    elif name in ["A*", "ASTAR"]:
-        return AStarSolver
-    else:
+    name = ALIASES.get(name, name)
+    if name not in SOLVERS:
         raise ValueError(f"Unknown algorithm: {name}")
+    return SOLVERS[name]
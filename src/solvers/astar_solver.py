@@ -1,77 +1,83 @@
 from solvers.base_solver import BaseSolver
-import heapq
+from solvers.heuristics import get_heuristic
+from solvers.priority_queue import BucketQueue
 import time
 
 class AStarSolver(BaseSolver):
+    def __init__(self, board, move_model="step", heuristic="blocking"):
+        super().__init__(board, move_model)
+        setup_start = time.perf_counter()
+        self.heuristic_fn = get_heuristic(heuristic, self)
+        self.heuristic_setup_time = time.perf_counter() - setup_start
+        self.heuristic_time = 0.0
+        self.heuristic_calls = 0
+
     def solve(self):
         start = time.time()
-        heap = []
-        counter = 0
-        heapq.heappush(heap, (0 + self.heuristic(self.initial_state), counter, self.initial_state, []))
-        visited = set()
+        observer = self.observer
+        self.search_started()
+        self.heuristic_time = 0.0
+        self.heuristic_calls = 0
+        queue = BucketQueue()
+        queue.push(self.initial_state.positions, self.heuristic(self.initial_state), (0, self.initial_state, None))
+        visited = self.new_visited_store()
+        self.frontier = queue
         expanded = 0
+        max_space = 0
 
-        while heap:
-            _, _, state, path = heapq.heappop(heap)
-            key = tuple(state)
-            if key in visited:
+        while queue:
+            key, _, (cost, state, parent) = queue.pop()
+            ref = visited.add(key, parent)
+            if ref is None:
+                if observer is not None:
+                    observer.duplicate_pruned(key)
                 continue
-            visited.add(key)
+
+            max_space = max(max_space, len(queue) + len(visited))
 
             if self.is_goal(state):
-                return {
-                    "time": time.time() - start,
-                    "space": len(visited) + len(heap),
-                    "expanded": expanded,
-                    "path": path + [state]
-                }
+                if observer is not None:
+                    observer.goal_found(key)
+                return self._result(start, max_space, expanded, self.reconstruct_path(visited, ref), visited)
 
+            new_cost = cost + 1
             for neighbor in self.expand(state):
-                counter += 1
-                cost = len(path) + 1
-                heapq.heappush(heap, (cost + self.heuristic(neighbor), counter, neighbor, path + [state]))
+                neighbor_key = neighbor.positions
+                if neighbor_key in visited:
+                    if observer is not None:
+                        observer.duplicate_pruned(neighbor_key)
+                    continue
+                queued = queue.get(neighbor_key)
+                if queued is None:
+                    f = new_cost + self.heuristic(neighbor)
+                else:
+                    # h của trạng thái đã biết: f cũ trừ g cũ, khỏi tính lại heuristic
+                    f = queued[0] - queued[1][0] + new_cost
+                if not queue.push(neighbor_key, f, (new_cost, neighbor, ref)) and observer is not None:
+                    observer.duplicate_pruned(neighbor_key)
             expanded += 1
 
-        return {
+        return self._result(start, max_space, expanded, [], visited)
+
+    def _result(self, start, space, expanded, path, visited=None):
+        result = {
             "time": time.time() - start,
-            "space": len(visited) + len(heap),
+            "space": space,
             "expanded": expanded,
-            "path": []
+            "path": path,
+            "heuristic": self.heuristic_fn.name,
+            "heuristic_time": self.heuristic_time,
+            "heuristic_calls": self.heuristic_calls,
+            "heuristic_setup_time": self.heuristic_setup_time
         }
+        if visited is not None:
+            result["bytes_per_state"] = visited.bytes_per_state()
+        return self.search_finished(result)
 
     def heuristic(self, state):
-        x_vehicle = None
-        for v in state:
-            if v[4] == "X":
-                x_vehicle = v
-                break
-        
-        if x_vehicle is None:
-            return 0
-            
-        x_row, x_col, x_length, x_orientation, _ = x_vehicle
-        
-        if x_orientation != 'H':
-            return float('inf')
-        
-        x_end_col = x_col + x_length
-        exit_col = self.board.size[1]
-        
-        if x_end_col >= exit_col:
-            return 0
-        
-        blocking_count = 0
-        for v in state:
-            if v[4] != "X":
-                v_row, v_col, v_length, v_orientation, _ = v
-                
-                if v_orientation == 'V':
-                    if (v_col > x_end_col - 1 and v_col < exit_col and 
-                        v_row <= x_row < v_row + v_length):
-                        blocking_count += 1
-                elif v_orientation == 'H':
-                    if (v_row == x_row and 
-                        v_col > x_end_col - 1 and v_col < exit_col):
-                        blocking_count += 1
-        
-        return blocking_count
+        """Evaluate the selected heuristic and account for the time it takes."""
+        evaluation_start = time.perf_counter()
+        value = self.heuristic_fn(state)
+        self.heuristic_time += time.perf_counter() - evaluation_start
+        self.heuristic_calls += 1
+        return value
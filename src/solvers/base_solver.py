@@ -1,67 +1,179 @@
+from rushhour.state import BoardSpec, board_hash
+from rushhour.validation import validate_vehicles
+from solvers.visited import parse_visited_store
+import functools
+import time
+
+
+class SolverInterrupted(Exception):
+    """Raised from ``expand`` when a running search has to stop early."""
+
+
+class SolverTimeout(SolverInterrupted):
+    """Raised from ``expand`` once a solver runs past its deadline."""
+
+
+class SolverCancelled(SolverInterrupted):
+    """Raised from ``expand`` after ``cancelled`` was set from another thread."""
+
+
+def _notify_aborted(solve):
+    """Wrap a ``solve`` so the observer hears about searches that raise."""
+    @functools.wraps(solve)
+    def wrapper(self):
+        try:
+            return solve(self)
+        except BaseException as error:
+            self.search_aborted(error)
+            raise
+    wrapper.notifies_aborted = True
+    return wrapper
+
+
 class BaseSolver:
-    def __init__(self, board):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Bọc solve của mọi solver con: khi tìm kiếm bị ngắt bằng ngoại lệ
+        # (SolverTimeout, SolverCancelled, ...) search_finished không được gọi
+        solve = cls.__dict__.get("solve")
+        if solve is not None and not getattr(solve, "notifies_aborted", False):
+            cls.solve = _notify_aborted(solve)
+
+    def __init__(self, board, move_model="step"):
         self.board = board
-        self.initial_state = self.serialize_board(board)
+        vehicles = board.serialize()
+        # Báo lỗi ngay thay vì để tìm kiếm duyệt hết không gian trạng thái
+        validate_vehicles(board.size, vehicles)
+        self.spec = BoardSpec(board.size, vehicles)
+        self.initial_state = self.spec.encode(vehicles)
+        # "step": mỗi nước đi một ô; "slide": trượt một xe bao xa tuỳ ý
+        self.move_model = move_model
+        self.moves = self.spec.move_table(move_model)
+        # Mốc thời gian (time.time()) mà sau đó expand sẽ dừng tìm kiếm; None = không giới hạn
+        self.deadline = None
+        self.cancelled = False
+        # Tiến độ cho các luồng khác đọc: số lần expand và container frontier hiện tại
+        self.expansions = 0
+        self.frontier = ()
+        # SolverObserver nhận các sự kiện tìm kiếm (xem solvers/observers.py); None = tắt
+        self.observer = None
+        # Tên kho trạng thái đã thăm, có thể kèm tham số như "bloom:capacity=200000"
+        # (xem solvers/visited.py), hoặc hàm tạo kho
+        self.visited_store = "dict"
+
+    def board_hash(self):
+        """Canonical hash of the board being solved (see ``rushhour.state.board_hash``)."""
+        return board_hash(self.board.size, self.board.serialize())
+
+    def visited_store_factory(self):
+        """
+        Resolve ``visited_store`` to a store constructor and its arguments.
+
+        Returns:
+            tuple: (store class or callable, keyword arguments).
 
-    def serialize_board(self, board):
-        return tuple(
-            (v.row, v.col, v.length, v.orientation, v.name)
-            for v in board.vehicles.values()
-        )
+        Raises:
+            ValueError: If the store cannot hold this board's position vectors.
+        """
+        store, kwargs = self.visited_store, {}
+        if isinstance(store, str):
+            store, kwargs = parse_visited_store(store)
+        max_key_bits = getattr(store, "max_key_bits", None)
+        key_bits = self.spec.count * self.spec.bits
+        if max_key_bits is not None and key_bits > max_key_bits:
+            raise ValueError(f"{getattr(store, '__name__', store)} holds keys of at most {max_key_bits} bits, "
+                             f"this board needs {key_bits}")
+        return store, kwargs
+
+    def new_visited_store(self):
+        """
+        Create an empty store of the kind selected by ``visited_store``.
+
+        Raises:
+            ValueError: If the store cannot hold this board's position vectors.
+        """
+        store, kwargs = self.visited_store_factory()
+        return store(**kwargs)
+
+    def reconstruct_path(self, visited, ref):
+        """
+        Rebuild the solution path from a visited store.
+
+        Solvers close a state with ``visited.add(key, parent_ref)`` and hand
+        the returned reference to its children, so no per-node path is copied
+        during search.
+
+        Args:
+            visited (VisitedStore): Store holding every closed state.
+            ref: Reference returned by ``visited.add`` for the goal state.
+
+        Returns:
+            list: States from the initial state to the goal, as tuples of
+            (row, col, length, orientation, name).
+        """
+        return [self.spec.decode(positions) for positions in visited.path(ref)]
 
     def is_goal(self, state):
-        for v in state:
-            if v[4] == "X":
-                if v[1] + v[2] == self.board.size[1]:
-                    return True
-        return False
+        return self.spec.is_goal(state)
+
+    def check_interrupted(self):
+        """Raise if the search was cancelled or ran past its deadline."""
+        if self.cancelled:
+            raise SolverCancelled(f"{type(self).__name__} was cancelled")
+        if self.deadline is not None and time.time() > self.deadline:
+            raise SolverTimeout(f"{type(self).__name__} exceeded its time limit")
 
     def expand(self, state):
-        next_states = []
-        
-        board_grid = [[None for _ in range(self.board.size[1])] for _ in range(self.board.size[0])]
-        
-        for vehicle in state:
-            row, col, length, orientation, name = vehicle
-            if orientation == 'H':
-                for c in range(col, col + length):
-                    if 0 <= row < self.board.size[0] and 0 <= c < self.board.size[1]:
-                        board_grid[row][c] = name
-            else:
-                for r in range(row, row + length):
-                    if 0 <= r < self.board.size[0] and 0 <= col < self.board.size[1]:
-                        board_grid[r][col] = name
-        
-        for i, vehicle in enumerate(state):
-            row, col, length, orientation, name = vehicle
-            
-            if orientation == 'H':
-                new_col = col - 1
-                if new_col >= 0 and board_grid[row][new_col] is None:
-                    new_state = list(state)
-                    new_state[i] = (row, new_col, length, orientation, name)
-                    next_states.append(tuple(new_state))
-                
-                new_col = col + length
-                if new_col < self.board.size[1] and board_grid[row][new_col] is None:
-                    new_state = list(state)
-                    new_state[i] = (row, col + 1, length, orientation, name)
-                    next_states.append(tuple(new_state))
-            
-            else:
-                new_row = row - 1
-                if new_row >= 0 and board_grid[new_row][col] is None:
-                    new_state = list(state)
-                    new_state[i] = (new_row, col, length, orientation, name)
-                    next_states.append(tuple(new_state))
-                
-                new_row = row + length
-                if new_row < self.board.size[0] and board_grid[new_row][col] is None:
-                    new_state = list(state)
-                    new_state[i] = (row + 1, col, length, orientation, name)
-                    next_states.append(tuple(new_state))
-        
-        return next_states
+        self.expansions += 1
+        self.check_interrupted()
+        if self.observer is not None:
+            return self._observed_expand(state)
+        return self.spec.successors(state, self.moves)
+
+    def _observed_expand(self, state):
+        observer = self.observer
+        key = state.positions
+        children = list(self.spec.successors(state, self.moves))
+        observer.node_expanded(key, len(children))
+        for child in children:
+            observer.node_generated(child.positions, key)
+        observer.frontier_sampled(len(self.frontier))
+        return iter(children)
+
+    def expand_moves(self, state):
+        """
+        Like ``expand``, but yield (child, moved vehicle index, cells moved).
+
+        See ``BoardSpec.transitions``.
+        """
+        self.expansions += 1
+        self.check_interrupted()
+        if self.observer is None:
+            return self.spec.transitions(state, self.moves)
+        observer = self.observer
+        key = state.positions
+        transitions = list(self.spec.transitions(state, self.moves))
+        observer.node_expanded(key, len(transitions))
+        for child, _, _ in transitions:
+            observer.node_generated(child.positions, key)
+        observer.frontier_sampled(len(self.frontier))
+        return iter(transitions)
+
+    def search_started(self):
+        """Notify the observer, if any, that ``solve`` is starting from the initial state."""
+        if self.observer is not None:
+            self.observer.search_started(self.initial_state.positions)
+
+    def search_finished(self, result):
+        """Notify the observer, if any, of the final result and return it unchanged."""
+        if self.observer is not None:
+            self.observer.search_finished(result)
+        return result
+
+    def search_aborted(self, error):
+        """Notify the observer, if any, that ``solve`` is raising ``error`` instead of returning."""
+        if self.observer is not None:
+            self.observer.search_aborted(error)
 
     def solve(self):
         raise NotImplementedError
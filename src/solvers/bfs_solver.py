@@ -5,35 +5,44 @@ import time
 class BFSSolver(BaseSolver):
     def solve(self):
         start = time.time()
-        queue = deque([(self.initial_state, [])])
-        visited = set()
+        observer = self.observer
+        self.search_started()
+        queue = deque([(self.initial_state, None)])
+        visited = self.new_visited_store()
+        self.frontier = queue
         expanded = 0
         max_space = 0
 
         while queue:
-            state, path = queue.popleft()
-            key = tuple(state)
-            if key in visited:
+            state, parent = queue.popleft()
+            key = state.positions
+            ref = visited.add(key, parent)
+            if ref is None:
+                if observer is not None:
+                    observer.duplicate_pruned(key)
                 continue
-            visited.add(key)
 
             max_space = max(max_space, len(queue) + len(visited))
 
             if self.is_goal(state):
-                return {
+                if observer is not None:
+                    observer.goal_found(key)
+                return self.search_finished({
                     "time": time.time() - start,
                     "space": max_space,
                     "expanded": expanded,
-                    "path": path + [state]
-                }
+                    "bytes_per_state": visited.bytes_per_state(),
+                    "path": self.reconstruct_path(visited, ref)
+                })
 
             for neighbor in self.expand(state):
-                queue.append((neighbor, path + [state]))
+                queue.append((neighbor, ref))
             expanded += 1
 
-        return {
+        return self.search_finished({
             "time": time.time() - start,
             "space": max_space,
             "expanded": expanded,
+            "bytes_per_state": visited.bytes_per_state(),
             "path": []
-        }
+        })
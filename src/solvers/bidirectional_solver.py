@@ -0,0 +1,133 @@
+from solvers.base_solver import BaseSolver
+import time
+
+class BidirectionalBFSSolver(BaseSolver):
+    """
+    Breadth-first search from the initial state and from the goal set at once.
+
+    Moves are reversible, so the backward search uses the same ``expand``.
+    Its first layer is the set of goal states, which is pulled from
+    ``BoardSpec.goal_states`` lazily: only as many goals are enumerated as are
+    needed to tell whether the backward frontier is still larger than the
+    forward one. The side with the smaller frontier is expanded next, and the
+    backward side can only expand once the goal layer is complete.
+
+    With every vehicle free to sit anywhere in its lane, the goal set is
+    large: thousands of placements on the bundled 6x6 maps, more than the
+    whole forward search expands on most of them. The backward side then
+    never expands, and the search expands the same states as the
+    layer-synchronous ``VectorizedBFSSolver`` (bounded by b^d, not
+    b^(d/2)). Backward layers only run when the goal set is small next to
+    the forward frontier. Results report ``forward_expanded`` and
+    ``backward_expanded`` separately.
+    """
+
+    def solve(self):
+        start = time.time()
+        self.search_started()
+        initial_key = self.initial_state.positions
+        forward = self.new_visited_store()
+        # backward: cha của mỗi trạng thái là trạng thái kế tiếp trên đường về đích (None nếu là đích)
+        backward = self.new_visited_store()
+        if not forward.exact:
+            raise ValueError("Bidirectional search needs an exact visited store")
+        forward.add(initial_key, None)
+        forward_layer = [self.initial_state]
+        backward_layer = []
+        goals = self.spec.goal_states()
+        goals_done = False
+        expanded = [0, 0]
+        max_space = 1
+
+        if self.is_goal(self.initial_state):
+            if self.observer is not None:
+                self.observer.goal_found(initial_key)
+            return self._result(start, max_space, expanded, forward, backward, initial_key)
+
+        while forward_layer:
+            # Chỉ liệt kê thêm trạng thái đích khi frontier ngược chưa lớn hơn frontier xuôi
+            while not goals_done and len(backward_layer) <= len(forward_layer):
+                goal = next(goals, None)
+                if goal is None:
+                    goals_done = True
+                elif backward.add(goal.positions, None) is not None:
+                    backward_layer.append(goal)
+
+            if goals_done and not backward_layer:
+                break
+
+            if goals_done and len(backward_layer) < len(forward_layer):
+                expanded[1] += len(backward_layer)
+                backward_layer, meets = self._expand_layer(backward_layer, backward, forward)
+            else:
+                expanded[0] += len(forward_layer)
+                forward_layer, meets = self._expand_layer(forward_layer, forward, backward, check_goal=True)
+
+            max_space = max(max_space, len(forward) + len(backward))
+
+            if meets:
+                best = min(meets, key=lambda key: self._depth(forward, key) + self._depth(backward, key))
+                if self.observer is not None:
+                    self.observer.goal_found(best)
+                return self._result(start, max_space, expanded, forward, backward, best)
+
+        return self.search_finished({
+            "time": time.time() - start,
+            "space": max_space,
+            "expanded": sum(expanded),
+            "forward_expanded": expanded[0],
+            "backward_expanded": expanded[1],
+            "bytes_per_state": self._bytes_per_state(forward, backward),
+            "path": []
+        })
+
+    def _expand_layer(self, layer, parents, other, check_goal=False):
+        observer = self.observer
+        next_layer = []
+        self.frontier = next_layer
+        meets = []
+        for state in layer:
+            key = state.positions
+            for neighbor in self.expand(state):
+                neighbor_key = neighbor.positions
+                if parents.add(neighbor_key, key) is None:
+                    if observer is not None:
+                        observer.duplicate_pruned(neighbor_key)
+                    continue
+                next_layer.append(neighbor)
+                if neighbor_key in other:
+                    meets.append(neighbor_key)
+                elif check_goal and self.is_goal(neighbor):
+                    # Đích chưa được liệt kê ở phía ngược
+                    other.add(neighbor_key, None)
+                    meets.append(neighbor_key)
+        return next_layer, meets
+
+    def _depth(self, parents, key):
+        depth = 0
+        key = parents.parent(key)
+        while key is not None:
+            key = parents.parent(key)
+            depth += 1
+        return depth
+
+    def _result(self, start, max_space, expanded, forward, backward, meet_key):
+        """Join the two half-paths at ``meet_key``; ``expanded`` is [forward, backward]."""
+        path = self.reconstruct_path(forward, meet_key)
+        key = backward.parent(meet_key) if meet_key in backward else None
+        while key is not None:
+            path.append(self.spec.decode(key))
+            key = backward.parent(key)
+        return self.search_finished({
+            "time": time.time() - start,
+            "space": max_space,
+            "expanded": sum(expanded),
+            "forward_expanded": expanded[0],
+            "backward_expanded": expanded[1],
+            "bytes_per_state": self._bytes_per_state(forward, backward),
+            "path": path
+        })
+
+    def _bytes_per_state(self, forward, backward):
+        states = len(forward) + len(backward)
+        return (forward.nbytes() + backward.nbytes()) / states if states else 0.0
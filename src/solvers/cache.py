@@ -0,0 +1,94 @@
+import json
+import os
+import sqlite3
+import time
+
+class SolutionCache:
+    """
+    On-disk cache of solver results backed by SQLite.
+
+    Entries are keyed by the board's canonical hash, the algorithm and the
+    move model. Every hit refreshes the entry's ``last_used`` stamp, and once
+    the table holds more than ``max_entries`` rows the least recently used
+    ones are evicted.
+
+    Args:
+        path (str): SQLite database file; created if missing.
+        max_entries (int): Maximum number of cached results.
+    """
+
+    # Một kết nối dùng chung cho mỗi file, để mỗi lần mở scene không mở thêm kết nối SQLite
+    _shared = {}
+
+    def __init__(self, path, max_entries=1000):
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used)"
+        )
+        self.connection.commit()
+
+    @classmethod
+    def shared(cls, path, max_entries=1000):
+        """Return the cache stored in ``path``, opening it on first use."""
+        key = os.path.abspath(path)
+        cache = cls._shared.get(key)
+        if cache is None:
+            cache = cls._shared[key] = cls(path, max_entries)
+        cache.max_entries = max_entries
+        return cache
+
+    @staticmethod
+    def make_key(solver, algorithm):
+        return f"{solver.board_hash()}:{algorithm.upper()}:{solver.move_model}"
+
+    def get(self, key):
+        """
+        Look up a cached result.
+
+        Returns:
+            dict: The stored result with ``path`` as tuples again and
+            ``cached`` set to True, or None on a miss.
+        """
+        row = self.connection.execute(
+            "SELECT result FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self.connection.execute(
+            "UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        self.connection.commit()
+
+        result = json.loads(row[0])
+        result["path"] = [tuple(tuple(v) for v in state) for state in result["path"]]
+        result["cached"] = True
+        return result
+
+    def put(self, key, result):
+        result = {k: v for k, v in result.items() if k != "cached"}
+        self.connection.execute(
+            "INSERT OR REPLACE INTO solutions (key, result, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(result), time.time())
+        )
+        # Xoá các mục ít được dùng gần đây nhất khi vượt quá giới hạn
+        self.connection.execute(
+            "DELETE FROM solutions WHERE key IN ("
+            "SELECT key FROM solutions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self.connection.commit()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        for key, cache in list(self._shared.items()):
+            if cache is self:
+                del self._shared[key]
+        self.connection.close()
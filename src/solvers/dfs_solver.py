@@ -4,35 +4,44 @@ import time
 class DFSSolver(BaseSolver):
     def solve(self):
         start = time.time()
-        stack = [(self.initial_state, [])]
-        visited = set()
+        observer = self.observer
+        self.search_started()
+        stack = [(self.initial_state, None)]
+        visited = self.new_visited_store()
+        self.frontier = stack
         expanded = 0
         max_space = 0
 
         while stack:
-            state, path = stack.pop()
-            key = tuple(state)
-            if key in visited:
+            state, parent = stack.pop()
+            key = state.positions
+            ref = visited.add(key, parent)
+            if ref is None:
+                if observer is not None:
+                    observer.duplicate_pruned(key)
                 continue
-            visited.add(key)
 
             max_space = max(max_space, len(stack) + len(visited))
 
             if self.is_goal(state):
-                return {
+                if observer is not None:
+                    observer.goal_found(key)
+                return self.search_finished({
                     "time": time.time() - start,
                     "space": max_space,
                     "expanded": expanded,
-                    "path": path + [state]
-                }
+                    "bytes_per_state": visited.bytes_per_state(),
+                    "path": self.reconstruct_path(visited, ref)
+                })
 
             for neighbor in self.expand(state):
-                stack.append((neighbor, path + [state]))
+                stack.append((neighbor, ref))
             expanded += 1
 
-        return {
+        return self.search_finished({
             "time": time.time() - start,
             "space": max_space,
             "expanded": expanded,
+            "bytes_per_state": visited.bytes_per_state(),
             "path": []
-        }
+        })
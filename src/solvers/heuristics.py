@@ -0,0 +1,332 @@
+"""
+Admissible heuristics for AStarSolver.
+
+Every heuristic is a class registered under a name with ``register_heuristic``
+and built once per solver, so any per-board precomputation happens in
+``__init__``. Calling the instance with a State returns a lower bound on the
+number of moves left under the solver's move model.
+"""
+from collections import deque
+from config import SETTINGS
+from rushhour.distances import DistanceDatabase
+from rushhour.state import BoardSpec
+
+HEURISTICS = {}
+
+
+def register_heuristic(name):
+    def decorator(cls):
+        cls.name = name
+        HEURISTICS[name] = cls
+        return cls
+    return decorator
+
+
+def get_heuristic(name, solver):
+    """
+    Build the heuristic registered under ``name`` for ``solver``.
+
+    Raises:
+        ValueError: If no heuristic is registered under that name.
+    """
+    if name not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic: {name}")
+    return HEURISTICS[name](solver)
+
+
+class BaseHeuristic:
+    name = None
+
+    def __init__(self, solver):
+        spec = solver.spec
+        self.spec = spec
+        self.slide = solver.move_model == "slide"
+        self.x = spec.target
+        if self.x is not None:
+            self.x_row = spec.lanes[self.x]
+            self.x_length = spec.lengths[self.x]
+            # path_masks[p]: các ô trên hàng của X, từ đầu xe X (ở vị trí p) tới lối ra
+            self.path_masks = tuple(
+                self._row_mask(p + self.x_length, spec.cols)
+                for p in range(len(spec.masks[self.x]))
+            )
+        # lane_masks[i]: mọi ô mà xe i có thể chiếm
+        self.lane_masks = tuple(
+            _union(masks) for masks in spec.masks
+        )
+
+    def _row_mask(self, start, stop):
+        mask = 0
+        for c in range(start, stop):
+            mask |= 1 << (self.x_row * self.spec.cols + c)
+        return mask
+
+    def x_moves(self, x_position):
+        """Lower bound on X's own moves to reach the exit."""
+        if self.slide:
+            return 1
+        return self.spec.goal_position - x_position
+
+    def occupants(self, state, cells, exclude=()):
+        """Return the indices of vehicles covering any of ``cells`` in ``state``."""
+        spec = self.spec
+        found = []
+        if not state.occupied & cells:
+            return found
+        for i in range(spec.count):
+            if i in exclude or not self.lane_masks[i] & cells:
+                continue
+            if spec.masks[i][spec.position(state, i)] & cells:
+                found.append(i)
+        return found
+
+    def __call__(self, state):
+        raise NotImplementedError
+
+
+def _union(masks):
+    mask = 0
+    for m in masks:
+        mask |= m
+    return mask
+
+
+@register_heuristic("zero")
+class ZeroHeuristic(BaseHeuristic):
+    """Always 0; turns A* into UCS and IDA* into iterative deepening DFS."""
+
+    def __call__(self, state):
+        return 0
+
+
+@register_heuristic("blocking")
+class BlockingHeuristic(BaseHeuristic):
+    """Number of vehicles standing between X and the exit."""
+
+    def __call__(self, state):
+        spec = self.spec
+        if self.x is None:
+            return 0
+        if spec.goal_position is None:
+            return float('inf')
+
+        x_position = spec.position(state, self.x)
+        if x_position == spec.goal_position:
+            return 0
+        return len(self.occupants(state, self.path_masks[x_position], (self.x,)))
+
+
+class ClearingHeuristic(BaseHeuristic):
+    """Shared helpers for heuristics that reason about how blockers clear a cell set."""
+
+    def clearing_options(self, state, index, cells):
+        """
+        List the ways vehicle ``index`` can move off ``cells``.
+
+        For each direction the smallest displacement that leaves ``cells`` is
+        taken, since any longer move sweeps a superset of its cells.
+
+        Returns:
+            list: (distance, swept cells) per feasible direction.
+        """
+        spec = self.spec
+        masks = spec.masks[index]
+        position = spec.position(state, index)
+        current = masks[position]
+        options = []
+        for direction in (-1, 1):
+            target = position
+            swept = 0
+            while masks[target] & cells:
+                target += direction
+                if not 0 <= target <= spec.limits[index]:
+                    break
+                swept |= masks[target] & ~current
+            else:
+                options.append((abs(target - position), swept))
+        return options
+
+
+@register_heuristic("min_moves_to_clear")
+class MinMovesToClearHeuristic(ClearingHeuristic):
+    """
+    X's own moves plus, for every direct blocker, the fewest moves it needs to
+    get out of X's row.
+
+    Under the step model a blocker needs one move per cell of displacement;
+    under the slide model every blocker needs at least one move.
+    """
+
+    def __call__(self, state):
+        spec = self.spec
+        if self.x is None:
+            return 0
+        if spec.goal_position is None:
+            return float('inf')
+
+        x_position = spec.position(state, self.x)
+        if x_position == spec.goal_position:
+            return 0
+
+        path = self.path_masks[x_position]
+        total = self.x_moves(x_position)
+        for blocker in self.occupants(state, path, (self.x,)):
+            options = self.clearing_options(state, blocker, path)
+            if not options:
+                return float('inf')
+            total += 1 if self.slide else min(distance for distance, _ in options)
+        return total
+
+
+@register_heuristic("blockers_of_blockers")
+class BlockersOfBlockersHeuristic(ClearingHeuristic):
+    """
+    Recursive lower bound on the set of vehicles that must move.
+
+    Every direct blocker of X must move. A vehicle that must vacate some cells
+    can do so in at most two directions; whatever occupies the cells it would
+    sweep in every feasible direction must move first, and those vehicles
+    are expanded the same way. Each vehicle in the resulting set is counted
+    once (or by its minimum displacement under the step model), plus X's own
+    moves.
+    """
+
+    def __call__(self, state):
+        spec = self.spec
+        if self.x is None:
+            return 0
+        if spec.goal_position is None:
+            return float('inf')
+
+        x_position = spec.position(state, self.x)
+        if x_position == spec.goal_position:
+            return 0
+
+        path = self.path_masks[x_position]
+        costs = {}
+        pending = [(blocker, path) for blocker in self.occupants(state, path, (self.x,))]
+        for blocker, _ in pending:
+            costs[blocker] = 1
+
+        while pending:
+            index, cells = pending.pop()
+            options = self.clearing_options(state, index, cells)
+            if not options:
+                return float('inf')
+            if not self.slide:
+                costs[index] = max(costs[index], min(distance for distance, _ in options))
+
+            # Những ô bị quét ở mọi hướng: xe đang chiếm chúng buộc phải di chuyển
+            required = options[0][1]
+            for _, swept in options[1:]:
+                required &= swept
+            for other in self.occupants(state, required, (self.x, index)):
+                if other not in costs:
+                    costs[other] = 1
+                    other_cells = spec.masks[other][spec.position(state, other)] & required
+                    pending.append((other, other_cells))
+
+        return self.x_moves(x_position) + sum(costs.values())
+
+
+@register_heuristic("pattern_database")
+class PatternDatabaseHeuristic(BaseHeuristic):
+    """
+    Exact distances in an abstraction that keeps only X and the vehicles that
+    can cross X's path to the exit.
+
+    Removing vehicles only removes obstacles, so the abstract distance never
+    exceeds the real one. The abstract state space reachable from the initial
+    board is enumerated once and solved by a multi-source BFS from its goal
+    states; evaluating a state is then a projection and a dict lookup.
+    """
+
+    max_vehicles = 6
+
+    def __init__(self, solver):
+        super().__init__(solver)
+        spec = self.spec
+        self.table = {}
+        if self.x is None or spec.goal_position is None:
+            self.pattern = ()
+            return
+
+        initial = solver.initial_state
+        ahead = self.path_masks[spec.position(initial, self.x)] | self.path_masks[0]
+        blocking = set(self.occupants(initial, ahead, (self.x,)))
+        crossing = [
+            i for i in range(spec.count)
+            if i != self.x and self.lane_masks[i] & self.path_masks[0]
+        ]
+        # Ưu tiên các xe đang chắn X, sau đó tới các xe gần X nhất
+        crossing.sort(key=lambda i: (i not in blocking, spec.lanes[i]))
+        self.pattern = (self.x,) + tuple(crossing[:self.max_vehicles - 1])
+
+        vehicles = spec.decode(initial.positions)
+        vehicles = [vehicles[i] for i in self.pattern]
+        self.sub_spec = BoardSpec((spec.rows, spec.cols), vehicles)
+        self.table = self._build(self.sub_spec.encode(vehicles), self.sub_spec.move_table(solver.move_model))
+
+    def project(self, state):
+        spec = self.spec
+        positions = state.positions
+        field_mask = spec.field_mask
+        shifts = spec.shifts
+        sub_shifts = self.sub_spec.shifts
+        projected = 0
+        for k, i in enumerate(self.pattern):
+            projected |= ((positions >> shifts[i]) & field_mask) << sub_shifts[k]
+        return projected
+
+    def _build(self, start, moves):
+        sub_spec = self.sub_spec
+        reachable = {start.positions: start}
+        queue = deque([start])
+        while queue:
+            for child in sub_spec.successors(queue.popleft(), moves):
+                if child.positions not in reachable:
+                    reachable[child.positions] = child
+                    queue.append(child)
+
+        table = {}
+        queue = deque()
+        for key, state in reachable.items():
+            if sub_spec.is_goal(state):
+                table[key] = 0
+                queue.append(state)
+        while queue:
+            state = queue.popleft()
+            distance = table[state.positions] + 1
+            for child in sub_spec.successors(state, moves):
+                if child.positions not in table:
+                    table[child.positions] = distance
+                    queue.append(child)
+        return table
+
+    def __call__(self, state):
+        if not self.pattern:
+            return 0 if self.x is None else float('inf')
+        return self.table.get(self.project(state), float('inf'))
+
+
+@register_heuristic("exact")
+class ExactHeuristic(BaseHeuristic):
+    """
+    True distance to the goal, read from a DistanceDatabase.
+
+    The database for the board and move model is loaded from
+    ``SETTINGS["DISTANCE_DB_DIR"]`` when ``build_distances.py`` has produced one, and otherwise built in
+    memory, which enumerates the whole reachable component up front.
+    """
+
+    def __init__(self, solver):
+        super().__init__(solver)
+        vehicles = solver.board.serialize()
+        self.database = DistanceDatabase.find(SETTINGS["DISTANCE_DB_DIR"], solver.board_hash(), solver.move_model)
+        if self.database is None:
+            self.database = DistanceDatabase.build(solver.board.size, vehicles, solver.move_model)
+        self.key = self.database.key_mapper(self.spec)
+
+    def __call__(self, state):
+        distance = self.database.lookup(self.key(state.positions))
+        return float('inf') if distance is None else distance
@@ -0,0 +1,97 @@
+from solvers.astar_solver import AStarSolver
+import time
+
+class IDAStarSolver(AStarSolver):
+    """
+    Iterative-deepening A*.
+
+    Runs depth-first searches bounded by f = g + h, raising the bound to the
+    smallest f that exceeded it until a goal is found. Only the current path
+    is kept, so memory grows linearly with solution depth. An optional
+    transposition table, capped at ``table_size`` entries and cleared every
+    iteration, prunes states already reached at a lower or equal depth.
+    """
+
+    def __init__(self, board, move_model="step", heuristic="blocking", table_size=65536, max_depth=None):
+        super().__init__(board, move_model, heuristic)
+        self.table_size = table_size
+        self.max_depth = max_depth
+
+    def solve(self):
+        start = time.time()
+        observer = self.observer
+        self.search_started()
+        self.heuristic_time = 0.0
+        self.heuristic_calls = 0
+        root = self.initial_state
+        expanded = 0
+        max_space = 1
+
+        if self.is_goal(root):
+            if observer is not None:
+                observer.goal_found(root.positions)
+            return self._result(start, max_space, expanded, [self.spec.decode(root.positions)])
+
+        bound = self.heuristic(root)
+        while bound != float('inf'):
+            if self.max_depth is not None and bound > self.max_depth:
+                break
+
+            next_bound = float('inf')
+            table = {}
+            path = [root]
+            on_path = {root.positions}
+            frontier = [self.expand(root)]
+            self.frontier = path
+            expanded += 1
+
+            while frontier:
+                child = next(frontier[-1], None)
+                if child is None:
+                    frontier.pop()
+                    on_path.discard(path.pop().positions)
+                    continue
+
+                key = child.positions
+                if key in on_path:
+                    if observer is not None:
+                        observer.duplicate_pruned(key)
+                    continue
+
+                cost = len(path)
+                if self.table_size:
+                    # Đã gặp trạng thái này ở độ sâu không lớn hơn trong lượt này
+                    if table.get(key, cost + 1) <= cost:
+                        if observer is not None:
+                            observer.duplicate_pruned(key)
+                        continue
+                    if key in table or len(table) < self.table_size:
+                        table[key] = cost
+
+                f = cost + self.heuristic(child)
+                if f > bound:
+                    next_bound = min(next_bound, f)
+                    continue
+
+                path.append(child)
+                if self.is_goal(child):
+                    if observer is not None:
+                        observer.goal_found(key)
+                    return self._result(start, max_space, expanded,
+                                        [self.spec.decode(state.positions) for state in path])
+
+                on_path.add(key)
+                frontier.append(self.expand(child))
+                expanded += 1
+                max_space = max(max_space, len(path) + len(table))
+
+            bound = next_bound
+
+        return self._result(start, max_space, expanded, [])
+
+
+class IDDFSSolver(IDAStarSolver):
+    """Iterative deepening DFS: IDA* with a zero heuristic, so the bound is the depth."""
+
+    def __init__(self, board, move_model="step", table_size=65536, max_depth=None):
+        super().__init__(board, move_model, "zero", table_size, max_depth)
@@ -0,0 +1,201 @@
+"""
+Search observers.
+
+Attach one with ``solver.observer = ...`` before calling ``solve()``. Solvers
+only check ``observer is not None`` on their hot paths, so an unobserved
+search pays a single comparison per event site.
+"""
+from collections import Counter
+import cProfile
+import io
+import pstats
+
+
+class SolverObserver:
+    """Base observer; every callback is a no-op so sinks override only what they need."""
+
+    def search_started(self, key):
+        pass
+
+    def node_expanded(self, key, children):
+        pass
+
+    def node_generated(self, key, parent_key):
+        pass
+
+    def duplicate_pruned(self, key):
+        pass
+
+    def goal_found(self, key):
+        pass
+
+    def frontier_sampled(self, size):
+        pass
+
+    def search_finished(self, result):
+        pass
+
+    def search_aborted(self, error):
+        """Called instead of ``search_finished`` when ``solve`` raises (timeout, cancel, bug)."""
+        pass
+
+
+class ObserverGroup(SolverObserver):
+    """Forward every callback to several observers."""
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+    def search_started(self, key):
+        for observer in self.observers:
+            observer.search_started(key)
+
+    def node_expanded(self, key, children):
+        for observer in self.observers:
+            observer.node_expanded(key, children)
+
+    def node_generated(self, key, parent_key):
+        for observer in self.observers:
+            observer.node_generated(key, parent_key)
+
+    def duplicate_pruned(self, key):
+        for observer in self.observers:
+            observer.duplicate_pruned(key)
+
+    def goal_found(self, key):
+        for observer in self.observers:
+            observer.goal_found(key)
+
+    def frontier_sampled(self, size):
+        for observer in self.observers:
+            observer.frontier_sampled(size)
+
+    def search_finished(self, result):
+        for observer in self.observers:
+            observer.search_finished(result)
+
+    def search_aborted(self, error):
+        for observer in self.observers:
+            observer.search_aborted(error)
+
+
+class CounterObserver(SolverObserver):
+    """Count every event and the largest frontier seen."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.max_frontier = 0
+
+    def node_expanded(self, key, children):
+        self.counts["expanded"] += 1
+
+    def node_generated(self, key, parent_key):
+        self.counts["generated"] += 1
+
+    def duplicate_pruned(self, key):
+        self.counts["duplicates"] += 1
+
+    def goal_found(self, key):
+        self.counts["goals"] += 1
+
+    def frontier_sampled(self, size):
+        self.counts["samples"] += 1
+        self.max_frontier = max(self.max_frontier, size)
+
+    def summary(self):
+        return dict(self.counts, max_frontier=self.max_frontier)
+
+
+class HistogramObserver(SolverObserver):
+    """
+    Branching factor and depth distributions of expanded nodes.
+
+    Depth is tracked from generation events: a state's depth is its parent's
+    plus one the first time it is generated, which is the BFS depth for
+    breadth-first solvers and the discovery depth for the others.
+    """
+
+    def __init__(self):
+        self.branching = Counter()
+        self.depths = Counter()
+        self.frontier_sizes = Counter()
+        self._depth = {}
+
+    def search_started(self, key):
+        self._depth = {key: 0}
+
+    def node_expanded(self, key, children):
+        self.branching[children] += 1
+        self.depths[self._depth.get(key, 0)] += 1
+
+    def node_generated(self, key, parent_key):
+        if key not in self._depth:
+            self._depth[key] = self._depth.get(parent_key, 0) + 1
+
+    def frontier_sampled(self, size):
+        # Gom kích thước frontier theo luỹ thừa của 2
+        self.frontier_sizes[size.bit_length()] += 1
+
+    def search_finished(self, result):
+        self._depth = {}
+
+    def search_aborted(self, error):
+        self._depth = {}
+
+    def mean_branching_factor(self):
+        total = sum(self.branching.values())
+        if not total:
+            return 0.0
+        return sum(children * count for children, count in self.branching.items()) / total
+
+
+class ProfilingObserver(SolverObserver):
+    """
+    Profile the search from ``search_started`` to ``search_finished``.
+
+    Args:
+        backend (str): "cprofile" (standard library) or "pyinstrument"
+            (must be installed separately).
+    """
+
+    def __init__(self, backend="cprofile"):
+        if backend == "cprofile":
+            self.profiler = cProfile.Profile()
+        elif backend == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise ImportError("ProfilingObserver(backend='pyinstrument') requires the pyinstrument package")
+            self.profiler = Profiler()
+        else:
+            raise ValueError(f"Unknown profiler backend: {backend}")
+        self.backend = backend
+        self.running = False
+
+    def search_started(self, key):
+        if self.backend == "cprofile":
+            self.profiler.enable()
+        else:
+            self.profiler.start()
+        self.running = True
+
+    def search_aborted(self, error):
+        # Không dừng ở đây thì cProfile vẫn bật và đo tiếp phần còn lại của tiến trình
+        self.search_finished(None)
+
+    def search_finished(self, result):
+        if not self.running:
+            return
+        if self.backend == "cprofile":
+            self.profiler.disable()
+        else:
+            self.profiler.stop()
+        self.running = False
+
+    def report(self, limit=20):
+        """Return the profile as text, hottest functions first."""
+        if self.backend == "pyinstrument":
+            return self.profiler.output_text()
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
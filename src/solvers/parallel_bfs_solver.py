@@ -0,0 +1,283 @@
+from solvers.base_solver import BaseSolver
+from rushhour.state import BoardSpec, State
+from array import array
+from collections import Counter
+import multiprocessing
+import numpy as np
+import os
+import time
+
+# Mỗi trạng thái con được gắn nhãn (hạng của cha trong lớp << ORDINAL_BITS) | thứ tự con
+ORDINAL_BITS = 16
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def owner_of(key, partitions):
+    """Partition owning a position vector (multiplicative hashing)."""
+    return (((key * HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> 32) % partitions
+
+
+def _partition_worker(connection, size, vehicles, move_model, partitions, store, store_kwargs):
+    """
+    Serve one partition of the visited set until told to stop.
+
+    The partition keeps ``parents``, a visited store built from ``store``
+    and ``store_kwargs``, for the states it owns and the part of
+    the current layer they form, in layer order with their global ranks.
+    States cross process boundaries as flat ``array('Q')`` buffers of
+    (child, parent, tag) triples.
+    """
+    spec = BoardSpec(size, vehicles)
+    moves = spec.move_table(move_model)
+    parents = store(**store_kwargs)
+    frontier = []
+    ranks = array('Q')
+
+    while True:
+        command, payload = connection.recv()
+        if command == "seed":
+            parents.add(payload, None)
+            frontier = [payload]
+            connection.send(None)
+
+        elif command == "ranks":
+            ranks = array('Q')
+            ranks.frombytes(payload)
+            connection.send(None)
+
+        elif command == "expand":
+            outgoing = [array('Q') for _ in range(partitions)]
+            for key, rank in zip(frontier, ranks):
+                tag = rank << ORDINAL_BITS
+                for ordinal, child in enumerate(spec.successors(State(key, spec.occupancy(key)), moves)):
+                    child_key = child.positions
+                    out = outgoing[(((child_key * HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> 32) % partitions]
+                    out.append(child_key)
+                    out.append(key)
+                    out.append(tag | ordinal)
+            connection.send([out.tobytes() for out in outgoing])
+
+        elif command == "merge":
+            # Giữ bản sao có nhãn nhỏ nhất: đúng bản mà BFS tuần tự đưa vào hàng đợi trước
+            best = {}
+            for blob in payload:
+                triples = array('Q')
+                triples.frombytes(blob)
+                for j in range(0, len(triples), 3):
+                    key = triples[j]
+                    if key in parents:
+                        continue
+                    tag = triples[j + 2]
+                    current = best.get(key)
+                    if current is None or tag < current[0]:
+                        best[key] = (tag, triples[j + 1])
+            frontier = sorted(best, key=lambda key: best[key][0])
+            for key in frontier:
+                parents.add(key, best[key][1])
+            goal = None
+            for index, key in enumerate(frontier):
+                if spec.is_goal(State(key, 0)):
+                    goal = (index, key)
+                    break
+            connection.send((array('Q', (best[key][0] for key in frontier)).tobytes(), goal))
+
+        elif command == "parent":
+            connection.send(parents.parent(payload))
+
+        elif command == "memory":
+            connection.send((len(parents), parents.nbytes()))
+
+        elif command == "stop":
+            connection.close()
+            return
+
+
+class ParallelBFSSolver(BaseSolver):
+    """
+    Level-synchronous BFS with the visited set hash-partitioned across processes.
+
+    Every worker process owns the states that hash to it: it alone stores their
+    parents and deduplicates them, so no lock is shared. For each layer the
+    workers expand their own frontier states, the children are routed to their
+    owners as packed 64-bit triples, and each owner merges what it receives.
+
+    Children are tagged with their parent's rank in the layer and their index
+    among the parent's successors, and every layer is kept in tag order. That
+    is exactly the order in which ``BFSSolver``'s FIFO queue visits states, so
+    the first goal, its path and the ``expanded`` count match the sequential
+    solver.
+
+    Observers get node events a layer at a time, read from the children
+    routed through the coordinator (see ``_observe_layer``). The events cover
+    the whole goal layer, so they can count more expansions than the result.
+
+    Each partition keeps its states in its own store of the kind selected by
+    ``visited_store`` (exact stores only; the store class and arguments are
+    sent to the workers, so a custom store must be picklable where processes
+    are spawned rather than forked). ``bytes_per_state`` sums the stores of
+    all partitions.
+
+    Args:
+        workers (int): Number of partitions/processes (default: one per CPU).
+    """
+
+    def __init__(self, board, move_model="step", workers=None):
+        super().__init__(board, move_model)
+        if self.spec.count * self.spec.bits > 64:
+            raise ValueError("Board too large for 64-bit packed states")
+        self.workers = workers or os.cpu_count() or 1
+
+    def solve(self):
+        start = time.time()
+        observer = self.observer
+        self.search_started()
+        initial_key = self.initial_state.positions
+        if self.is_goal(self.initial_state):
+            if observer is not None:
+                observer.goal_found(initial_key)
+            return self.search_finished({
+                "time": time.time() - start,
+                "space": 1,
+                "expanded": 0,
+                "path": [self.spec.decode(initial_key)]
+            })
+
+        store, store_kwargs = self.visited_store_factory()
+        if not getattr(store, "exact", True):
+            raise ValueError("Parallel BFS needs an exact visited store")
+        partitions = self.workers
+        vehicles = self.board.serialize()
+        connections = []
+        processes = []
+        for _ in range(partitions):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_partition_worker,
+                args=(child_end, self.board.size, vehicles, self.move_model, partitions, store, store_kwargs),
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            connections.append(parent_end)
+            processes.append(process)
+
+        try:
+            return self.search_finished(self._search(start, connections, initial_key))
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(("stop", None))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+
+    def _search(self, start, connections, initial_key):
+        observer = self.observer
+        partitions = len(connections)
+        seed_owner = connections[owner_of(initial_key, partitions)]
+        seed_owner.send(("seed", initial_key))
+        seed_owner.recv()
+        seed_owner.send(("ranks", array('Q', [0]).tobytes()))
+        seed_owner.recv()
+
+        expanded = 0
+        visited = 1
+        layer_size = 1
+        self.frontier = range(layer_size)
+
+        while layer_size:
+            self.expansions += layer_size
+            self.check_interrupted()
+            for connection in connections:
+                connection.send(("expand", None))
+            outgoing = [connection.recv() for connection in connections]
+            if observer is not None:
+                self._observe_layer(outgoing)
+            for target, connection in enumerate(connections):
+                connection.send(("merge", [blobs[target] for blobs in outgoing]))
+            merged = [connection.recv() for connection in connections]
+
+            tags = [np.frombuffer(blob, dtype=np.uint64) for blob, _ in merged]
+            ordered = np.sort(np.concatenate(tags))
+            ranks = [np.searchsorted(ordered, part).astype(np.uint64) for part in tags]
+
+            goal_rank = None
+            goal_key = None
+            for part, (_, goal) in zip(ranks, merged):
+                if goal is not None and (goal_rank is None or part[goal[0]] < goal_rank):
+                    goal_rank = int(part[goal[0]])
+                    goal_key = goal[1]
+            if goal_key is not None:
+                if observer is not None:
+                    observer.goal_found(goal_key)
+                return {
+                    "time": time.time() - start,
+                    "space": visited + len(ordered),
+                    "expanded": expanded + layer_size + goal_rank,
+                    "bytes_per_state": self._bytes_per_state(connections),
+                    "path": self._path(connections, goal_key)
+                }
+
+            for connection, part in zip(connections, ranks):
+                connection.send(("ranks", part.tobytes()))
+            for connection in connections:
+                connection.recv()
+
+            expanded += layer_size
+            layer_size = len(ordered)
+            visited += layer_size
+            self.frontier = range(layer_size)
+            if observer is not None:
+                observer.frontier_sampled(layer_size)
+
+        return {
+            "time": time.time() - start,
+            "space": visited,
+            "expanded": expanded,
+            "bytes_per_state": self._bytes_per_state(connections),
+            "path": []
+        }
+
+    def _observe_layer(self, outgoing):
+        """
+        Report the node events of one layer from the routed (child, parent, tag) triples.
+
+        The coordinator never sees the frontier itself, only the children on
+        their way to their owners. A state with no legal move therefore gets
+        no ``node_expanded`` event, and since deduplication happens inside
+        the workers, no ``duplicate_pruned`` events are sent.
+        """
+        observer = self.observer
+        children = Counter()
+        triples = []
+        for blobs in outgoing:
+            for blob in blobs:
+                triples.append(np.frombuffer(blob, dtype=np.uint64).reshape(-1, 3)[:, :2])
+        pairs = np.concatenate(triples).tolist() if triples else []
+        for _, parent in pairs:
+            children[parent] += 1
+        for key, count in children.items():
+            observer.node_expanded(key, count)
+        for child, parent in pairs:
+            observer.node_generated(child, parent)
+
+    def _bytes_per_state(self, connections):
+        """Bytes per stored state over every partition's visited store."""
+        for connection in connections:
+            connection.send(("memory", None))
+        sizes = [connection.recv() for connection in connections]
+        states = sum(count for count, _ in sizes)
+        return sum(nbytes for _, nbytes in sizes) / states if states else 0.0
+
+    def _path(self, connections, key):
+        keys = []
+        while key is not None:
+            keys.append(key)
+            connection = connections[owner_of(key, len(connections))]
+            connection.send(("parent", key))
+            key = connection.recv()
+        keys.reverse()
+        return [self.spec.decode(positions) for positions in keys]
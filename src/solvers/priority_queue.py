@@ -0,0 +1,73 @@
+"""
+Bucket priority queue with decrease-key for UCS and A*.
+
+Path costs and f-values on Rush Hour boards are small integers, so the queue
+keeps one FIFO bucket per distinct priority plus a small heap of the
+priorities that have a bucket. Every state is queued at most once: pushing
+a state that is already queued either lowers its priority or is ignored.
+Lowering leaves the old bucket entry behind as a bare key that ``pop``
+skips, so duplicates never carry a payload.
+
+Within a bucket states come out in insertion order, the same order the
+``(priority, counter)`` tuples of a ``heapq`` frontier would give.
+"""
+from collections import deque
+import heapq
+
+
+class BucketQueue:
+    def __init__(self):
+        # buckets[p]: các khoá được đưa vào với độ ưu tiên p, theo thứ tự vào
+        self.buckets = {}
+        self.priorities = []
+        # entries[key] = (độ ưu tiên hiện tại, dữ liệu kèm theo)
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Return ``(priority, item)`` for a queued key, or None."""
+        return self.entries.get(key)
+
+    def push(self, key, priority, item):
+        """
+        Queue ``key`` or lower its priority.
+
+        Returns:
+            bool: False if ``key`` is already queued with a priority no higher
+            than ``priority`` (nothing changes), True otherwise.
+        """
+        current = self.entries.get(key)
+        if current is not None and current[0] <= priority:
+            return False
+        self.entries[key] = (priority, item)
+        bucket = self.buckets.get(priority)
+        if bucket is None:
+            bucket = self.buckets[priority] = deque()
+            heapq.heappush(self.priorities, priority)
+        bucket.append(key)
+        return True
+
+    def pop(self):
+        """
+        Remove the lowest-priority key, first in first out among equals.
+
+        Returns:
+            tuple: (key, priority, item).
+        """
+        while True:
+            priority = self.priorities[0]
+            bucket = self.buckets[priority]
+            key = bucket.popleft()
+            if not bucket:
+                del self.buckets[priority]
+                heapq.heappop(self.priorities)
+            entry = self.entries.get(key)
+            # Bỏ qua bản cũ còn sót lại sau khi khoá đã được hạ độ ưu tiên hoặc đã lấy ra
+            if entry is not None and entry[0] == priority:
+                del self.entries[key]
+                return key, priority, entry[1]
@@ -1,51 +1,97 @@
 from solvers.base_solver import BaseSolver
-import heapq
+from solvers.priority_queue import BucketQueue
 import time
 
+# Chi phí một nước đi theo (spec, chỉ số xe di chuyển, số ô đã đi)
+COST_MODELS = {
+    "length": lambda spec, index, distance: spec.lengths[index],
+    "distance": lambda spec, index, distance: distance,
+    "unit": lambda spec, index, distance: 1,
+}
+
+
+def get_cost_model(name):
+    """
+    Return the cost function registered under ``name``.
+
+    Raises:
+        ValueError: If no cost model is registered under that name.
+    """
+    if name not in COST_MODELS:
+        raise ValueError(f"Unknown cost model: {name}")
+    return COST_MODELS[name]
+
+
 class UCSSolver(BaseSolver):
-    def get_move_cost(self, from_state, to_state):
-        """Calculate cost based on the length of the vehicle that moved"""
-        for i, (from_vehicle, to_vehicle) in enumerate(zip(from_state, to_state)):
-            if from_vehicle != to_vehicle:
-                _, _, length, _, _ = to_vehicle
-                return length
-        return 1
-    
+    """
+    Uniform cost search over move costs given by a cost model.
+
+    Args:
+        cost_model (str): "length" (default) charges the length of the moved
+            vehicle, "distance" the number of cells it moved and "unit" one
+            per move.
+    """
+
+    def __init__(self, board, move_model="step", cost_model="length"):
+        super().__init__(board, move_model)
+        self.cost_model = cost_model
+        cost = get_cost_model(cost_model)
+        spec = self.spec
+        # move_costs[i][d]: chi phí khi xe i đi d ô
+        self.move_costs = tuple(
+            tuple(cost(spec, i, distance) for distance in range(len(spec.masks[i])))
+            for i in range(spec.count)
+        )
+
     def solve(self):
         start = time.time()
-        heap = [(0, 0, self.initial_state, [])]
-        visited = set()
+        observer = self.observer
+        self.search_started()
+        queue = BucketQueue()
+        queue.push(self.initial_state.positions, 0, (self.initial_state, None))
+        visited = self.new_visited_store()
+        move_costs = self.move_costs
+        self.frontier = queue
         expanded = 0
-        counter = 0
         max_space = 0
 
-        while heap:
-            cost, _, state, path = heapq.heappop(heap)
-            key = tuple(state)
-            if key in visited:
+        while queue:
+            key, cost, (state, parent) = queue.pop()
+            ref = visited.add(key, parent)
+            if ref is None:
+                if observer is not None:
+                    observer.duplicate_pruned(key)
                 continue
-            visited.add(key)
 
-            max_space = max(max_space, len(heap) + len(visited))
+            max_space = max(max_space, len(queue) + len(visited))
 
             if self.is_goal(state):
-                return {
+                if observer is not None:
+                    observer.goal_found(key)
+                return self.search_finished({
                     "time": time.time() - start,
                     "space": max_space,
                     "expanded": expanded,
-                    "path": path + [state]
-                }
-
-            for neighbor in self.expand(state):
-                counter += 1
-                move_cost = self.get_move_cost(state, neighbor)
-                new_cost = cost + move_cost
-                heapq.heappush(heap, (new_cost, counter, neighbor, path + [state]))
+                    "cost": cost,
+                    "cost_model": self.cost_model,
+                    "bytes_per_state": visited.bytes_per_state(),
+                    "path": self.reconstruct_path(visited, ref)
+                })
+
+            for neighbor, index, distance in self.expand_moves(state):
+                neighbor_key = neighbor.positions
+                if neighbor_key in visited or not queue.push(
+                        neighbor_key, cost + move_costs[index][distance], (neighbor, ref)):
+                    if observer is not None:
+                        observer.duplicate_pruned(neighbor_key)
             expanded += 1
 
-        return {
+        return self.search_finished({
             "time": time.time() - start,
             "space": max_space,
             "expanded": expanded,
+            "cost": None,
+            "cost_model": self.cost_model,
+            "bytes_per_state": visited.bytes_per_state(),
             "path": []
-        }
+        })
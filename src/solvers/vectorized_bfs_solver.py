@@ -0,0 +1,146 @@
+from solvers.base_solver import BaseSolver
+from rushhour.layers import LayerExpander
+import numpy as np
+import time
+
+
+class VectorizedBFSSolver(BaseSolver):
+    """
+    Layer-synchronous BFS that expands a whole frontier layer with NumPy.
+
+    Each layer is a sorted ``uint64`` array of position vectors, expanded
+    with ``rushhour.layers.LayerExpander``. Moves are reversible, so the move
+    graph is undirected and a state first seen at depth d + 1 can only be
+    rediscovered in layers d, d + 1 and d + 2; new children are therefore
+    deduplicated against the current and previous layers with sorted-array
+    searches instead of a global visited set.
+
+    The goal test runs when a layer is built, so ``expanded`` counts every
+    state of the layers before the goal's and the path, while optimal, may
+    differ from ``BFSSolver``'s among equally short ones.
+
+    There is no global visited set, so ``visited_store`` is ignored: the
+    layers and their parent-index arrays are the whole bookkeeping, about
+    16 bytes per state, and ``bytes_per_state`` reports their size.
+
+    With an observer attached, the node events of each layer are replayed
+    from its arrays after the layer is expanded, so observers see the same
+    events as for the other solvers, grouped by layer.
+    """
+
+    def __init__(self, board, move_model="step"):
+        super().__init__(board, move_model)
+        self.expander = LayerExpander(self.spec, move_model)
+
+    def expand_layer(self, layer):
+        """
+        Generate every child of every state in ``layer``.
+
+        Returns:
+            tuple: (children, parent indices into ``layer``) as NumPy arrays.
+        """
+        self.expansions += len(layer)
+        self.check_interrupted()
+        return self.expander.expand(layer)
+
+    def solve(self):
+        start = time.time()
+        observer = self.observer
+        self.search_started()
+        layer = np.array([self.initial_state.positions], dtype=np.uint64)
+        previous = np.empty(0, dtype=np.uint64)
+        # layers[d] = (mảng trạng thái ở độ sâu d, chỉ số cha trong layers[d - 1])
+        layers = [(layer, None)]
+        self.frontier = layer
+        expanded = 0
+        visited = 1
+        max_space = 1
+
+        while len(layer):
+            goals = self._goals(layer)
+            if len(goals):
+                if observer is not None:
+                    observer.goal_found(int(layer[goals[0]]))
+                return self.search_finished({
+                    "time": time.time() - start,
+                    "space": max_space,
+                    "expanded": expanded,
+                    "bytes_per_state": self._bytes_per_state(layers),
+                    "path": self._path(layers, goals[0])
+                })
+
+            generated, generated_parents = self.expand_layer(layer)
+            expanded += len(layer)
+            children, first = np.unique(generated, return_index=True)
+            parent_indices = generated_parents[first]
+            fresh = ~(self._contains(layer, children) | self._contains(previous, children))
+            if observer is not None:
+                self._observe_layer(layer, generated, generated_parents, first[fresh])
+            previous = layer
+            layer = children[fresh]
+            layers.append((layer, parent_indices[fresh]))
+            self.frontier = layer
+
+            visited += len(layer)
+            max_space = max(max_space, visited)
+            if observer is not None:
+                observer.frontier_sampled(len(layer))
+
+        return self.search_finished({
+            "time": time.time() - start,
+            "space": max_space,
+            "expanded": expanded,
+            "bytes_per_state": self._bytes_per_state(layers),
+            "path": []
+        })
+
+    def _observe_layer(self, layer, children, parent_indices, kept):
+        """
+        Replay the per-state observer events of one expanded layer.
+
+        Every state of ``layer`` gets ``node_expanded`` with its number of
+        children and every child ``node_generated``, in the order the arrays
+        hold them; children other than those at ``kept`` are reported as
+        pruned duplicates. This loop only runs with an observer attached.
+        """
+        observer = self.observer
+        keys = layer.tolist()
+        for key, count in zip(keys, np.bincount(parent_indices, minlength=len(layer)).tolist()):
+            observer.node_expanded(key, count)
+        for child, parent in zip(children.tolist(), parent_indices.tolist()):
+            observer.node_generated(child, keys[parent])
+        pruned = np.ones(len(children), dtype=bool)
+        pruned[kept] = False
+        for child in children[pruned].tolist():
+            observer.duplicate_pruned(child)
+
+    @staticmethod
+    def _bytes_per_state(layers):
+        """Bytes per visited state of the layer and parent-index arrays."""
+        states = sum(len(layer) for layer, _ in layers)
+        nbytes = sum(layer.nbytes + (0 if parents is None else parents.nbytes) for layer, parents in layers)
+        return nbytes / states if states else 0.0
+
+    def _goals(self, layer):
+        spec = self.spec
+        if spec.goal_position is None:
+            return ()
+        x_positions = (layer >> np.uint64(spec.shifts[spec.target])) & np.uint64(spec.field_mask)
+        return np.flatnonzero(x_positions == spec.goal_position)
+
+    @staticmethod
+    def _contains(sorted_keys, keys):
+        if not len(sorted_keys):
+            return np.zeros(len(keys), dtype=bool)
+        indices = np.searchsorted(sorted_keys, keys)
+        indices[indices == len(sorted_keys)] = 0
+        return sorted_keys[indices] == keys
+
+    def _path(self, layers, index):
+        keys = []
+        for layer, parent_indices in reversed(layers):
+            keys.append(int(layer[index]))
+            if parent_indices is not None:
+                index = parent_indices[index]
+        keys.reverse()
+        return [self.spec.decode(positions) for positions in keys]
@@ -0,0 +1,276 @@
+"""
+Visited-state stores.
+
+Graph-search solvers record every closed state together with a reference to
+its parent, so the solution path can be rebuilt at the goal. A store hides
+how that is kept in memory. ``add(key, parent)`` closes a state and returns
+the reference its children should carry as their parent, or None if the
+state was already closed; ``path(ref)`` walks references back to the root.
+
+Stores are selected by name through ``BaseSolver.visited_store``:
+
+- "dict" (default): a Python dict from position vector to parent position
+  vector. Fastest, but every entry costs about 65 bytes.
+- "packed": an open-addressing hash table over two ``array('Q')`` columns
+  (key, parent) with linear probing, kept at most three quarters full.
+  Between 21 and 43 bytes per state depending on fill; exact. Position
+  vectors must fit in 63 bits (the all-ones value marks empty slots), so
+  boards wider than that are rejected when the store is created.
+- "bloom": a Bloom filter over a ``BitSet``. The filter is fixed up front by
+  ``capacity`` and ``error_rate``, about 1.44 * log2(1 / error_rate) bits per
+  expected state (29 bits at the default 1e-6). Parents are not stored in
+  the filter; each reference is a (key, parent reference) link held by the
+  solver's frontier. A frontier state keeps its whole chain of ancestors
+  alive, so the links of most closed states stay in memory too, at about
+  90 bytes each. ``nbytes`` and ``bytes_per_state`` count the filter only,
+  not these links; size memory for a Bloom search like a dict search. A
+  false positive makes the solver skip an unseen state, which with
+  probability about ``error_rate`` per lookup can lengthen the path or miss
+  a solution.
+
+A store is named by its registry key, optionally followed by constructor
+arguments: ``"bloom:capacity=200000,error_rate=1e-5"`` or
+``"packed:capacity=65536"`` (see ``parse_visited_store``).
+"""
+from array import array
+import math
+import sys
+
+from rushhour.bitset import BitSet
+
+EMPTY = 0xFFFFFFFFFFFFFFFF
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+SECOND_MULTIPLIER = 0xC2B2AE3D27D4EB4F
+
+
+class VisitedStore:
+    """Interface shared by all stores."""
+
+    exact = True
+    # Số bit tối đa của khoá mà kho lưu được; None = không giới hạn
+    max_key_bits = None
+
+    def add(self, key, parent):
+        raise NotImplementedError
+
+    def __contains__(self, key):
+        raise NotImplementedError
+
+    def parent(self, key):
+        raise NotImplementedError
+
+    def path(self, ref):
+        """Position vectors from the initial state to ``ref``'s state."""
+        keys = []
+        while ref is not None:
+            keys.append(ref)
+            ref = self.parent(ref)
+        keys.reverse()
+        return keys
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def nbytes(self):
+        raise NotImplementedError
+
+    def bytes_per_state(self):
+        return self.nbytes() / len(self) if len(self) else 0.0
+
+
+class DictStore(VisitedStore):
+    def __init__(self):
+        self.parents = {}
+
+    def add(self, key, parent):
+        parents = self.parents
+        if key in parents:
+            return None
+        parents[key] = parent
+        return key
+
+    def __contains__(self, key):
+        return key in self.parents
+
+    def parent(self, key):
+        return self.parents[key]
+
+    def __len__(self):
+        return len(self.parents)
+
+    def nbytes(self):
+        # Các giá trị cha trỏ tới cùng các đối tượng int với khoá nên chỉ đếm khoá
+        return sys.getsizeof(self.parents) + sum(sys.getsizeof(key) for key in self.parents)
+
+
+class PackedHashStore(VisitedStore):
+    """
+    Open-addressing hash table of 64-bit keys with a parallel parent column.
+
+    Keys must fit in ``max_key_bits`` = 63 bits, so ``EMPTY`` (all 64 bits
+    set) can never be a key and marks free slots and a missing parent.
+
+    Args:
+        capacity (int): Initial number of slots, rounded up to a power of two.
+    """
+
+    max_key_bits = 63
+
+    def __init__(self, capacity=1024):
+        self.bits = max(3, (capacity - 1).bit_length())
+        self.keys = array('Q', [EMPTY]) * (1 << self.bits)
+        self.parents = array('Q', [EMPTY]) * (1 << self.bits)
+        self.count = 0
+
+    def _slot(self, key):
+        mask = len(self.keys) - 1
+        keys = self.keys
+        slot = ((key * HASH_MULTIPLIER) & EMPTY) >> (64 - self.bits)
+        while True:
+            found = keys[slot]
+            if found == key or found == EMPTY:
+                return slot
+            slot = (slot + 1) & mask
+
+    def add(self, key, parent):
+        slot = self._slot(key)
+        if self.keys[slot] == key:
+            return None
+        self.keys[slot] = key
+        self.parents[slot] = EMPTY if parent is None else parent
+        self.count += 1
+        if 4 * self.count > 3 * len(self.keys):
+            self._grow()
+        return key
+
+    def _grow(self):
+        keys, parents = self.keys, self.parents
+        self.bits += 1
+        self.keys = array('Q', [EMPTY]) * (1 << self.bits)
+        self.parents = array('Q', [EMPTY]) * (1 << self.bits)
+        for key, parent in zip(keys, parents):
+            if key != EMPTY:
+                slot = self._slot(key)
+                self.keys[slot] = key
+                self.parents[slot] = parent
+
+    def __contains__(self, key):
+        return self.keys[self._slot(key)] == key
+
+    def parent(self, key):
+        slot = self._slot(key)
+        if self.keys[slot] != key:
+            raise KeyError(key)
+        parent = self.parents[slot]
+        return None if parent == EMPTY else parent
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        return self.keys.itemsize * len(self.keys) + self.parents.itemsize * len(self.parents)
+
+
+class BloomStore(VisitedStore):
+    """
+    Bloom filter membership with frontier-held parent links.
+
+    Args:
+        capacity (int): Expected number of states.
+        error_rate (float): Target false-positive rate at ``capacity`` states.
+    """
+
+    exact = False
+
+    def __init__(self, capacity=1_000_000, error_rate=1e-6):
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.filter = BitSet(self.size)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+
+    def _indexes(self, key):
+        first = (key * HASH_MULTIPLIER) & EMPTY
+        second = ((key * SECOND_MULTIPLIER) & EMPTY) | 1
+        size = self.size
+        return [(first + i * second) % size for i in range(self.hashes)]
+
+    def add(self, key, parent):
+        new = False
+        for index in self._indexes(key):
+            if self.filter.add(index):
+                new = True
+        if not new:
+            return None
+        self.count += 1
+        return (key, parent)
+
+    def __contains__(self, key):
+        return all(index in self.filter for index in self._indexes(key))
+
+    def parent(self, key):
+        raise TypeError("BloomStore does not store parents; follow the references returned by add()")
+
+    def path(self, ref):
+        keys = []
+        while ref is not None:
+            key, ref = ref
+            keys.append(key)
+        keys.reverse()
+        return keys
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        """Size of the filter; the (key, parent) links held by the frontier are not counted."""
+        return self.filter.nbytes
+
+    def false_positive_rate(self):
+        """Expected false-positive rate at the current fill."""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+VISITED_STORES = {
+    "dict": DictStore,
+    "packed": PackedHashStore,
+    "bloom": BloomStore,
+}
+
+
+def get_visited_store(name):
+    """
+    Return the store class registered under ``name``.
+
+    Raises:
+        ValueError: If no store is registered under that name.
+    """
+    if name not in VISITED_STORES:
+        raise ValueError(f"Unknown visited store: {name}")
+    return VISITED_STORES[name]
+
+
+def parse_visited_store(text):
+    """
+    Parse a store description such as ``"bloom:capacity=200000,error_rate=1e-5"``.
+
+    Returns:
+        tuple: (store class, keyword arguments for its constructor).
+
+    Raises:
+        ValueError: If the name is unknown or an argument is malformed.
+    """
+    name, _, arguments = text.partition(":")
+    store = get_visited_store(name)
+    kwargs = {}
+    for argument in filter(None, arguments.split(",")):
+        key, separator, value = argument.partition("=")
+        if not separator or not key.strip():
+            raise ValueError(f"Expected key=value in visited store arguments, got {argument!r}")
+        value = value.strip()
+        try:
+            kwargs[key.strip()] = int(value)
+        except ValueError:
+            kwargs[key.strip()] = float(value)
+    return store, kwargs
@@ -0,0 +1,63 @@
+from solvers.base_solver import SolverCancelled, SolverInterrupted
+import threading
+import time
+
+class SolverWorker:
+    """
+    Run ``solver.solve()`` on a background thread.
+
+    The caller polls ``done()`` and ``progress()`` from its own loop and reads
+    ``result`` or ``error`` once the thread has finished. ``cancel()`` asks the
+    solver to stop at its next expansion; a cancelled worker finishes with
+    neither a result nor an error. Expected failures (``SolverTimeout``,
+    ``ValueError``, ``MemoryError``) are only stored in ``error``; any other
+    exception is stored too and re-raised, so the thread's traceback is
+    printed instead of the bug being hidden behind an "Error" state.
+    """
+
+    def __init__(self, solver):
+        self.solver = solver
+        self.result = None
+        self.error = None
+        self.start_time = None
+        self.end_time = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.start_time = time.time()
+        self.thread.start()
+
+    def _run(self):
+        try:
+            self.result = self.solver.solve()
+        except SolverCancelled:
+            pass
+        except (ValueError, MemoryError, SolverInterrupted) as e:
+            self.error = e
+        except Exception as e:
+            # Lỗi lập trình: vẫn báo cho vòng lặp giao diện, nhưng để threading.excepthook in traceback
+            self.error = e
+            raise
+        finally:
+            self.end_time = time.time()
+
+    def done(self):
+        return self.end_time is not None
+
+    def cancel(self):
+        self.solver.cancelled = True
+
+    def progress(self):
+        """
+        Snapshot of the running search.
+
+        Returns:
+            dict: ``expanded`` (expand calls so far), ``frontier`` (current
+            frontier size) and ``elapsed`` (seconds since ``start``).
+        """
+        end = self.end_time if self.end_time is not None else time.time()
+        return {
+            "expanded": self.solver.expansions,
+            "frontier": len(self.solver.frontier),
+            "elapsed": end - self.start_time if self.start_time is not None else 0.0,
+        }
@@ -1,8 +1,6 @@
-import os
-import json
 import random
 from config import SETTINGS
-from core import Board, Vehicle
+from core import Board, MapCatalog, load_map_from_string
 
 def random_map():
     """
@@ -17,6 +15,8 @@ def load_map_from_json(json_data: str) -> Board:
     """
     Load a map from a JSON string and return a Board object.
     
+    Same as ``core.load_map_from_string``; kept for existing callers.
+    
     Args:
         json_data (str): JSON string containing map data.
     
@@ -24,38 +24,21 @@ def load_map_from_json(json_data: str) -> Board:
         Board: A Board object initialized with the map data.
     
     Raises:
-        ValueError: If the JSON data is invalid or does not contain the expected structure.
+        InvalidMapError: If the JSON data is invalid or does not describe a valid map.
     """
-    data = json.loads(json_data)
-    board_size = tuple(data["size"])
-    vehicles_data = data["vehicles"]
-
-    # Reset màu trước khi tạo vehicles mới
-    Vehicle.reset_colors()
-    vehicles = {}
-
-    for v in vehicles_data:
-        name = v["name"]
-        row = v["row"]
-        col = v["col"]
-        length = v["length"]
-        orientation = v["orientation"]
-        vehicles[name] = Vehicle(name, row, col, length, orientation)
-
-    return Board(board_size, vehicles)
+    return load_map_from_string(json_data)
 
 def get_list_maps(folder_path: str) -> list:
     """
     Get a list of map filenames from the specified folder.
     
+    The folder is indexed once by a shared ``MapCatalog``; later calls only
+    check whether the folder changed.
+    
     Args:
         folder_path (str): Path to the folder containing map files.
     
     Returns:
-        list: List of map filenames with .json extension.
+        list: List of map filenames with .json extension, in natural order.
     """
-    maps = []
-    for filename in os.listdir(folder_path):
-        if filename.endswith(".json"):
-            maps.append(filename)
-    return maps
\ No newline at end of file
+    return list(MapCatalog.shared(folder_path).names())
\ No newline at end of file
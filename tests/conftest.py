@@ -0,0 +1,7 @@
+import os
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+# config/config.json được đọc theo đường dẫn tương đối, giống khi chạy game từ src
+os.chdir(SRC)
@@ -18,38 +18,16 @@
 # }
 
 import os
+import sys
 import json
 
-def check_valid_positions(map_data):
-    size = map_data['size']
-    vehicles = map_data['vehicles']
-    
-    # Create a grid to represent the map
-    grid = [[None for _ in range(size[1])] for _ in range(size[0])]
-    
-    for vehicle in vehicles:
-        row, col, length, orientation = vehicle['row'], vehicle['col'], vehicle['length'], vehicle['orientation']
-        
-        if orientation == 'H':
-            if col + length > size[1]:
-                return False
-            for c in range(col, col + length):
-                if grid[row][c] is not None:
-                    return False
-                grid[row][c] = vehicle['name']
-        else:
-            if row + length > size[0]:
-                return False
-            for r in range(row, row + length):
-                if grid[r][col] is not None:
-                    return False
-                grid[r][col] = vehicle['name']
-    
-    return True
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from rushhour.validation import check_valid_positions
 
 # Example usage
 if __name__ == "__main__":
-    maps_folders = os.listdir('../src/maps')
+    maps_folders = [name for name in os.listdir('../src/maps') if name.endswith('.json')]
     for map_file in maps_folders:
         with open(f'../src/maps/{map_file}') as f:
             map_data = json.load(f)
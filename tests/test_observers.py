@@ -0,0 +1,46 @@
+import sys
+import time
+
+import pytest
+
+from core import load_map_from_json
+from solvers import BFSSolver, CounterObserver, ProfilingObserver, SolverObserver, SolverTimeout
+
+
+class Recorder(SolverObserver):
+    def __init__(self):
+        self.events = []
+
+    def search_finished(self, result):
+        self.events.append("finished")
+
+    def search_aborted(self, error):
+        self.events.append(type(error).__name__)
+
+
+def test_timeout_reports_aborted_search():
+    solver = BFSSolver(load_map_from_json('maps/map9.json'))
+    solver.observer = recorder = Recorder()
+    solver.deadline = time.time()
+    with pytest.raises(SolverTimeout):
+        solver.solve()
+    solver.deadline = None
+    solver.solve()
+    assert recorder.events == ["SolverTimeout", "finished"]
+
+
+def test_profiler_stops_when_search_raises():
+    solver = BFSSolver(load_map_from_json('maps/map9.json'))
+    solver.observer = profiler = ProfilingObserver("cprofile")
+    solver.deadline = time.time()
+    with pytest.raises(SolverTimeout):
+        solver.solve()
+    assert not profiler.running
+    assert sys.getprofile() is None
+
+
+def test_counter_counts_expansions():
+    solver = BFSSolver(load_map_from_json('maps/map10.json'))
+    solver.observer = counter = CounterObserver()
+    result = solver.solve()
+    assert counter.summary()["expanded"] == result["expanded"]
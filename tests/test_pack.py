@@ -0,0 +1,74 @@
+import glob
+import json
+import os
+
+import pytest
+
+from rushhour.pack import PackWriter, PuzzlePack, map_vehicles, pack_maps, unpack_maps
+from rushhour.state import BoardSpec
+
+MAP_PATHS = sorted(glob.glob(os.path.join('maps', '*.json')))
+
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = str(tmp_path / 'maps.rhpk')
+    assert pack_maps(MAP_PATHS, path) == len(MAP_PATHS)
+    return path
+
+
+def test_pack_keeps_every_map(pack_path):
+    with PuzzlePack(pack_path) as pack:
+        assert len(pack) == len(MAP_PATHS)
+        assert pack.size == (6, 6)
+        for index, path in enumerate(MAP_PATHS):
+            assert pack.name(index) == os.path.basename(path)
+            assert pack.map_data(index) == read(path)
+            assert pack[index] == map_vehicles(read(path))
+        assert list(pack) == [map_vehicles(read(path)) for path in MAP_PATHS]
+
+
+def test_unpack_round_trip(pack_path, tmp_path):
+    directory = tmp_path / 'unpacked'
+    assert unpack_maps(pack_path, str(directory)) == len(MAP_PATHS)
+    for path in MAP_PATHS:
+        assert read(str(directory / os.path.basename(path))) == read(path)
+
+
+def test_states_match_board_spec(pack_path):
+    with PuzzlePack(pack_path) as pack:
+        states = list(pack.states())
+    assert len(states) == len(MAP_PATHS)
+    for (spec, state), path in zip(states, MAP_PATHS):
+        data = read(path)
+        vehicles = map_vehicles(data)
+        assert state == BoardSpec(data['size'], vehicles).encode(vehicles)
+        assert spec.decode(state.positions) == vehicles
+
+
+def test_moves_are_kept(tmp_path):
+    data = dict(read(MAP_PATHS[0]), moves=12, move_model='slide')
+    path = str(tmp_path / 'one.rhpk')
+    with PackWriter(path, (6, 6), 18) as writer:
+        writer.add(data, 'one.json')
+    with PuzzlePack(path) as pack:
+        assert pack.map_data(0) == data
+
+
+def test_rejects_other_board_size(tmp_path):
+    data = read(MAP_PATHS[0])
+    with PackWriter(str(tmp_path / 'small.rhpk'), (5, 5), 12) as writer:
+        with pytest.raises(ValueError):
+            writer.add(data, 'map.json')
+
+
+def test_rejects_non_pack(tmp_path):
+    path = tmp_path / 'map.json'
+    path.write_text(json.dumps(read(MAP_PATHS[0])))
+    with pytest.raises(ValueError):
+        PuzzlePack(str(path))
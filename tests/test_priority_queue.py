@@ -0,0 +1,54 @@
+import heapq
+import random
+
+from core import load_map_from_json
+from solvers import AStarSolver, BFSSolver, UCSSolver
+from solvers.priority_queue import BucketQueue
+
+
+def test_pops_lowest_priority_first_in_first_out():
+    queue = BucketQueue()
+    for key, priority in (("a", 3), ("b", 1), ("c", 3), ("d", 1), ("e", 2)):
+        assert queue.push(key, priority, key.upper())
+    assert len(queue) == 5
+    assert [queue.pop() for _ in range(5)] == [
+        ("b", 1, "B"), ("d", 1, "D"), ("e", 2, "E"), ("a", 3, "A"), ("c", 3, "C")]
+    assert not queue
+
+
+def test_decrease_key_moves_entry_and_skips_stale_copy():
+    queue = BucketQueue()
+    queue.push("a", 5, "old")
+    queue.push("b", 4, None)
+    assert not queue.push("a", 6, "worse")
+    assert queue.push("a", 2, "new")
+    assert len(queue) == 2
+    assert "a" in queue and queue.get("a") == (2, "new")
+    assert queue.pop() == ("a", 2, "new")
+    assert queue.pop() == ("b", 4, None)
+    assert len(queue) == 0 and "a" not in queue
+
+
+def test_matches_heap_order():
+    rng = random.Random(1)
+    queue, heap, best = BucketQueue(), [], {}
+    for counter in range(2000):
+        key, priority = rng.randrange(300), rng.randrange(40)
+        if queue.push(key, priority, counter):
+            best[key] = priority
+            heapq.heappush(heap, (priority, counter, key))
+    order = []
+    while heap:
+        priority, _, key = heapq.heappop(heap)
+        if best.get(key) == priority:
+            del best[key]
+            order.append((key, priority))
+    assert [queue.pop()[:2] for _ in range(len(queue))] == order
+
+
+def test_ucs_and_astar_stay_optimal():
+    for number in (1, 4, 10):
+        board = load_map_from_json(f'maps/map{number}.json')
+        shortest = len(BFSSolver(board).solve()["path"])
+        for solver in (UCSSolver(board), AStarSolver(board)):
+            assert len(solver.solve()["path"]) == shortest
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from core import Board, Vehicle, load_map_from_json
+from solvers import BFSSolver
+from solvers.visited import BloomStore, DictStore, PackedHashStore, parse_visited_store
+
+
+def test_packed_store_matches_dict_store():
+    rng = random.Random(0)
+    keys = [rng.getrandbits(63) for _ in range(5000)]
+    packed, plain = PackedHashStore(capacity=8), DictStore()
+    parent = None
+    for key in keys + keys[:100]:
+        assert packed.add(key, parent) == plain.add(key, parent)
+        parent = key
+    assert len(packed) == len(plain) == len(set(keys))
+    for key in keys:
+        assert key in packed
+        assert packed.parent(key) == plain.parent(key)
+    assert packed.path(keys[50]) == plain.path(keys[50])
+
+
+def test_packed_store_rejects_unknown_parent_lookup():
+    with pytest.raises(KeyError):
+        PackedHashStore().parent(42)
+
+
+def test_bfs_paths_do_not_depend_on_store():
+    board = load_map_from_json('maps/map10.json')
+    paths = []
+    for store in ("dict", "packed"):
+        solver = BFSSolver(board)
+        solver.visited_store = store
+        paths.append(solver.solve()["path"])
+    assert paths[0] == paths[1]
+
+
+def test_packed_store_refuses_wide_keys():
+    # 9x9: 4 bit mỗi xe, 18 xe cần 72 bit
+    vehicles = [Vehicle("X", 4, 0, 2, 'H')]
+    vehicles += [Vehicle(chr(ord('A') + i), 0 if i % 2 else 7, i // 2, 2, 'V') for i in range(17)]
+    solver = BFSSolver(Board((9, 9), vehicles))
+    solver.visited_store = "packed"
+    with pytest.raises(ValueError):
+        solver.new_visited_store()
+
+
+def test_parse_visited_store():
+    assert parse_visited_store("dict") == (DictStore, {})
+    assert parse_visited_store("bloom:capacity=200000,error_rate=1e-5") == (
+        BloomStore, {"capacity": 200000, "error_rate": 1e-5})
+    with pytest.raises(ValueError):
+        parse_visited_store("bloom:capacity")
+    with pytest.raises(ValueError):
+        parse_visited_store("btree")